@@ -1,93 +1,185 @@
 import subprocess
 import os
+import sys
+import hashlib
 
-def build():
-        # Get the directory of this script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(script_dir))
-        
-        # Define standardized build output directories
-        build_output_dir = os.path.join(project_root, 'build_output')
-        portable_output_dir = os.path.join(build_output_dir, 'portable')
-        
-        # Create build output directories if they don't exist
-        os.makedirs(portable_output_dir, exist_ok=True)
-        
-        # Use the virtual environment's PyInstaller
-        pyinstaller_path = os.path.join(project_root, '.venv', 'Scripts', 'pyinstaller.exe')
+# Paths used by the build, resolved once at import
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+
+# Standardized build output directories
+BUILD_OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'build_output')
+PORTABLE_OUTPUT_DIR = os.path.join(BUILD_OUTPUT_DIR, 'portable')
+PORTABLE_EXE = os.path.join(PORTABLE_OUTPUT_DIR, 'downly', 'downly.exe')
+BUILD_HASH_PATH = os.path.join(BUILD_OUTPUT_DIR, '.build_hash')
+WORK_DIR = os.path.join(PROJECT_ROOT, 'build')
+
+# The virtual environment's PyInstaller
+PYINSTALLER_PATH = os.path.join(PROJECT_ROOT, '.venv', 'Scripts', 'pyinstaller.exe')
+
+# Build inputs
+MAIN_SCRIPT = os.path.join(PROJECT_ROOT, 'src', 'main.py')
+ASSETS_DIR = os.path.join(PROJECT_ROOT, 'src', 'assets')
+BINARIES_DIR = os.path.join(PROJECT_ROOT, 'binaries')
+ICON_PATH = os.path.join(ASSETS_DIR, 'icon.ico')
+LOGO_PATH = os.path.join(ASSETS_DIR, 'logo.png')
+FFMPEG_PATH = os.path.join(BINARIES_DIR, 'ffmpeg.exe')
+YTDLP_PATH = os.path.join(BINARIES_DIR, 'yt-dlp.exe')
+SPEC_PATH = os.path.join(SCRIPT_DIR, 'downly.spec')
+
+def list_dir_names(path):
+        """Return the set of entry names in a directory (empty if it doesn't exist)."""
+        try:
+                with os.scandir(path) as entries:
+                        return {entry.name for entry in entries}
+        except FileNotFoundError:
+                return set()
+
+def collect_build_inputs(project_root, extra_files):
+        """Return the sorted list of files whose contents determine the build output."""
+        inputs = list(extra_files)
+        for dirpath, dirnames, filenames in os.walk(os.path.join(project_root, 'src')):
+                dirnames[:] = [d for d in dirnames if d != '__pycache__']
+                inputs.extend(os.path.join(dirpath, name) for name in filenames)
+        return sorted(inputs)
+
+def compute_build_hash(input_files, command):
+        """Hash the contents of the build inputs together with the PyInstaller arguments."""
+        digest = hashlib.blake2b()
+        for path in input_files:
+                digest.update(path.encode())
+                with open(path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                                digest.update(chunk)
+        digest.update(repr(command).encode())
+        return digest.hexdigest()
+
+def read_build_hash(hash_path):
+        """Return the hash recorded by the last successful build, or None."""
+        try:
+                with open(hash_path) as f:
+                        return f.read().strip()
+        except OSError:
+                return None
+
+def run_pyinstaller(command, pyinstaller_main):
+        """Run PyInstaller in-process if available, otherwise as a subprocess."""
+        if pyinstaller_main is not None:
+                try:
+                        pyinstaller_main.run(command[1:])
+                except SystemExit as e:
+                        if e.code not in (None, 0):
+                                print(f"Build failed with error: {e}")
+                                return False
+                except Exception as e:
+                        print(f"Build failed with error: {e}")
+                        return False
+                print("Build completed successfully.")
+                return True
         
+        try:
+                result = subprocess.run(command, check=True)
+                print("Build completed successfully.")
+                return True
+        except subprocess.CalledProcessError as e:
+                print(f"Build failed with error: {e}")
+                return False
+        except FileNotFoundError as e:
+                print(f"PyInstaller not found: {e}")
+                print("Make sure PyInstaller is installed in the virtual environment.")
+                return False
+
+def check_build_inputs(pyinstaller_main):
+        """Check that PyInstaller and every build input exist, reporting what is missing."""
         # Check if PyInstaller exists
-        if not os.path.exists(pyinstaller_path):
-                print(f"Error: PyInstaller not found at: {pyinstaller_path}")
+        if pyinstaller_main is None and not os.path.exists(PYINSTALLER_PATH):
+                print(f"Error: PyInstaller not found at: {PYINSTALLER_PATH}")
                 print("Please ensure the virtual environment is set up and PyInstaller is installed.")
                 return False
         
         # Check if main script exists
-        main_script = os.path.join(project_root, 'src', 'main.py')
-        if not os.path.exists(main_script):
-                print(f"Error: Main script not found at: {main_script}")
+        if not os.path.exists(MAIN_SCRIPT):
+                print(f"Error: Main script not found at: {MAIN_SCRIPT}")
                 return False
         
-        # Check if required assets exist
-        icon_path = os.path.join(project_root, 'src', 'assets', 'icon.ico')
-        logo_path = os.path.join(project_root, 'src', 'assets', 'logo.png')
-        ffmpeg_path = os.path.join(project_root, 'binaries', 'ffmpeg.exe')
-        ytdlp_path = os.path.join(project_root, 'binaries', 'yt-dlp.exe')
+        # Check if required assets exist, scanning each parent directory once
+        # instead of stat-ing every file
+        present = {
+                ASSETS_DIR: list_dir_names(ASSETS_DIR),
+                BINARIES_DIR: list_dir_names(BINARIES_DIR)
+        }
+        required_files = [
+                ("Icon", ASSETS_DIR, ICON_PATH),
+                ("Logo", ASSETS_DIR, LOGO_PATH),
+                ("ffmpeg", BINARIES_DIR, FFMPEG_PATH),
+                ("yt-dlp", BINARIES_DIR, YTDLP_PATH)
+        ]
         
-        missing_files = []
-        if not os.path.exists(icon_path):
-                missing_files.append(f"Icon: {icon_path}")
-        if not os.path.exists(logo_path):
-                missing_files.append(f"Logo: {logo_path}")
-        if not os.path.exists(ffmpeg_path):
-                missing_files.append(f"ffmpeg: {ffmpeg_path}")
-        if not os.path.exists(ytdlp_path):
-                missing_files.append(f"yt-dlp: {ytdlp_path}")
+        missing_files = [
+                f"{name}: {path}"
+                for name, parent, path in required_files
+                if os.path.basename(path) not in present[parent]
+        ]
         
         if missing_files:
                 print("Error: Missing required files:")
                 for file in missing_files:
                         print(f"  - {file}")
-                if ffmpeg_path in [f.split(": ")[1] for f in missing_files]:
+                if FFMPEG_PATH in [f.split(": ")[1] for f in missing_files]:
                         print("  Please ensure ffmpeg.exe is in the binaries/ folder")
-                if ytdlp_path in [f.split(": ")[1] for f in missing_files]:
+                if YTDLP_PATH in [f.split(": ")[1] for f in missing_files]:
                         print("  Please ensure yt-dlp.exe is in the binaries/ folder")
                 return False
         
-        # Define the command to run PyInstaller
+        if not os.path.exists(SPEC_PATH):
+                print(f"Error: PyInstaller spec not found at: {SPEC_PATH}")
+                return False
+        
+        return True
+
+def build(force=False):
+        # Create build output directories if they don't exist
+        os.makedirs(PORTABLE_OUTPUT_DIR, exist_ok=True)
+        
+        # Prefer running PyInstaller in this interpreter over starting pyinstaller.exe
+        try:
+                import PyInstaller.__main__ as pyinstaller_main
+        except ImportError:
+                pyinstaller_main = None
+        
+        # build_all.py sets DOWNLY_DEPS_CHECKED after its own dependency check,
+        # which already covers every file checked here
+        if os.environ.get('DOWNLY_DEPS_CHECKED') != '1':
+                if not check_build_inputs(pyinstaller_main):
+                        return False
+        
+        # Define the command to run PyInstaller; building from the persistent
+        # spec lets PyInstaller reuse its Analysis cache
         command = [
-                pyinstaller_path,
-                # Specify the PyInstaller options
-                '--onedir',
-                '--windowed',
+                PYINSTALLER_PATH,
                 '--noconfirm',
-                '--icon=src/assets/icon.ico',
-                '--name=downly',
-                '--distpath', portable_output_dir,  # Output to standardized portable directory
-                '--workpath', os.path.join(project_root, 'build'),  # Keep build artifacts in build/
-                'src/main.py',
-                # Add additional data files and binaries
-                '--add-data', f'src/assets/icon.ico;assets',
-                '--add-data', f'src/assets/logo.png;assets',
-                '--add-binary', f'binaries/ffmpeg.exe;.',
-                '--add-binary', f'binaries/yt-dlp.exe;.'
+                '--distpath', PORTABLE_OUTPUT_DIR,  # Output to standardized portable directory
+                '--workpath', WORK_DIR,  # Keep build artifacts in build/
+                SPEC_PATH
         ]
 
+        # Skip PyInstaller entirely if nothing that feeds the build has changed
+        build_inputs = collect_build_inputs(PROJECT_ROOT, [FFMPEG_PATH, YTDLP_PATH, SPEC_PATH])
+        build_hash = compute_build_hash(build_inputs, command)
+        if not force and os.path.exists(PORTABLE_EXE) and read_build_hash(BUILD_HASH_PATH) == build_hash:
+                print("Build is up to date, skipping PyInstaller (use --force to rebuild).")
+                return True
+
         # Run the command
         print("Building Downly with PyInstaller...")
-        try:
-                result = subprocess.run(command, check=True)
-                print("Build completed successfully.")
-                return True
-        except subprocess.CalledProcessError as e:
-                print(f"Build failed with error: {e}")
-                return False
-        except FileNotFoundError as e:
-                print(f"PyInstaller not found: {e}")
-                print("Make sure PyInstaller is installed in the virtual environment.")
+        if not run_pyinstaller(command, pyinstaller_main):
                 return False
+        
+        with open(BUILD_HASH_PATH, 'w') as f:
+                f.write(build_hash)
+        return True
 
 if __name__ == '__main__':
-        success = build()
+        success = build(force='--force' in sys.argv[1:])
         if not success:
                 exit(1)
\ No newline at end of file
@@ -6,8 +6,11 @@ Builds the application and optionally creates the installer
 
 import os
 import sys
+import shlex
 import subprocess
 import argparse
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def run_command(command, description, check=True):
@@ -17,9 +20,9 @@ def run_command(command, description, check=True):
     
     try:
         if isinstance(command, str):
-            result = subprocess.run(command, shell=True, check=check)
-        else:
-            result = subprocess.run(command, check=check)
+            # Split ourselves rather than going through an extra shell process
+            command = shlex.split(command, posix=(os.name != 'nt'))
+        result = subprocess.run(command, check=check)
         
         if result.returncode == 0:
             print(f"✓ {description} completed successfully")
@@ -34,27 +37,85 @@ def run_command(command, description, check=True):
         print(f"✗ Command not found: {e}")
         return False
 
+def run_function(function, description):
+    """Run a build script's entry point in-process and report like run_command."""
+    print(f"\n{description}...")
+    
+    try:
+        success = function()
+    except Exception as e:
+        print(f"✗ {description} failed: {e}")
+        return False
+    
+    if success:
+        print(f"✓ {description} completed successfully")
+        return True
+    else:
+        print(f"✗ {description} failed")
+        return False
+
+def import_script(project_root, subdir, name):
+    """Import a script module from scripts/<subdir> so its functions can be called directly."""
+    script_dir = os.fspath(project_root / "scripts" / subdir)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    return importlib.import_module(name)
+
+def check_installer_prerequisites(project_root):
+    """
+    Check the installer inputs and create its output directory.
+    
+    Returns (ok, messages) so the caller can report once the application
+    build, which runs at the same time, has finished printing.
+    """
+    build_installer = import_script(project_root, "installer", "build_installer")
+    
+    messages = []
+    ok = True
+    if not os.path.exists(build_installer.ISSC_PATH):
+        messages.append(f"✗ Inno Setup compiler not found at: {build_installer.ISSC_PATH}")
+        ok = False
+    if not os.path.exists(build_installer.DOT_ISS_PATH):
+        messages.append(f"✗ ISS file not found at: {build_installer.DOT_ISS_PATH}")
+        ok = False
+    
+    os.makedirs(project_root / "build_output" / "installer", exist_ok=True)
+    return ok, messages
+
 def main():
     """Main build automation function."""
     parser = argparse.ArgumentParser(description="Build Downly application")
     parser.add_argument("--installer", action="store_true", help="Also build the installer")
     parser.add_argument("--clean", action="store_true", help="Clean build directories first")
     parser.add_argument("--check-only", action="store_true", help="Only check dependencies")
+    parser.add_argument("--subprocess", action="store_true", help="Run each build step in a separate Python process")
     
     args = parser.parse_args()
     
     project_root = Path(__file__).parent.parent.parent
     
+    # Script paths as strings, computed once for the command lines below
+    deps_script = os.fspath(project_root / "scripts" / "dependencies" / "check_dependencies.py")
+    build_script = os.fspath(project_root / "scripts" / "build" / "build.py")
+    installer_script = os.fspath(project_root / "scripts" / "installer" / "build_installer.py")
+    
     print("Downly Build Automation")
     print("=" * 40)
     
     # Check dependencies first
     print("\nStep 1: Checking dependencies...")
-    dep_check = run_command([sys.executable, str(project_root / "scripts" / "dependencies" / "check_dependencies.py")], "Dependency check")
+    if args.subprocess:
+        dep_check = run_command([sys.executable, deps_script], "Dependency check")
+    else:
+        check_dependencies = import_script(project_root, "dependencies", "check_dependencies")
+        dep_check = run_function(check_dependencies.main, "Dependency check")
     if not dep_check:
         print("Please fix missing dependencies before building.")
         return False
     
+    # Let build.py skip re-checking the same files (inherited by --subprocess runs too)
+    os.environ["DOWNLY_DEPS_CHECKED"] = "1"
+    
     if args.check_only:
         print("\n✓ Dependency check complete. Ready to build!")
         return True
@@ -79,7 +140,20 @@ def main():
     
     # Build the application
     print(f"\nStep {'3' if args.clean else '2'}: Building application...")
-    build_success = run_command([sys.executable, str(project_root / "scripts" / "build" / "build.py")], "Application build")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if args.subprocess:
+            build_future = executor.submit(run_command, [sys.executable, build_script], "Application build")
+        else:
+            build_module = import_script(project_root, "build", "build")
+            build_future = executor.submit(run_function, build_module.build, "Application build")
+        
+        # Only the installer compile depends on the build output, so check its
+        # prerequisites while PyInstaller is running
+        installer_ready, installer_messages = True, []
+        if args.installer:
+            installer_ready, installer_messages = check_installer_prerequisites(project_root)
+        
+        build_success = build_future.result()
     
     if not build_success:
         print("\n✗ Application build failed. Cannot proceed to installer.")
@@ -97,7 +171,13 @@ def main():
     if args.installer:
         step_num = '4' if args.clean else '3'
         print(f"\nStep {step_num}: Building installer...")
-        installer_success = run_command([sys.executable, str(project_root / "scripts" / "installer" / "build_installer.py")], "Installer build")
+        if not installer_ready:
+            for message in installer_messages:
+                print(message)
+            print("✗ Installer prerequisites are missing")
+            return False
+        
+        installer_success = run_command([sys.executable, installer_script], "Installer build")
         
         if installer_success:
             installer_output = project_root / "build_output" / "installer"
@@ -112,22 +192,25 @@ def main():
             return False
     
     # Summary
-    print("\n" + "=" * 40)
-    print("✓ Build process completed successfully!")
-    print(f"Application: {portable_exe}")
+    summary = ["\n" + "=" * 40,
+               "✓ Build process completed successfully!",
+               f"Application: {portable_exe}"]
     
     if args.installer:
         installer_output = project_root / "build_output" / "installer"
         installer_files = list(installer_output.glob("*.exe"))
         if installer_files:
-            print(f"Installer: {installer_files[0]}")
+            summary.append(f"Installer: {installer_files[0]}")
     
-    print("\nNext steps:")
-    print("1. Test the application by running the executable")
+    summary.append("\nNext steps:")
+    summary.append("1. Test the application by running the executable")
     if args.installer:
-        print("2. Test the installer on a clean system")
+        summary.append("2. Test the installer on a clean system")
     else:
-        print("2. Run with --installer flag to create installer")
+        summary.append("2. Run with --installer flag to create installer")
+    
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
     
     return True
 
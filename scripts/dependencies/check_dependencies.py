@@ -6,98 +6,179 @@ Verifies all required files and tools are available before building.
 
 import os
 import sys
+import shutil
+import hashlib
+import argparse
 import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
-def check_file_exists(path, name):
-    """Check if a file exists and report the result."""
-    if os.path.exists(path):
-        print(f"✓ {name}: Found at {path}")
-        return True
-    else:
-        print(f"✗ {name}: Missing at {path}")
-        return False
+CheckResult = namedtuple("CheckResult", ["ok", "message"])
+
+# Expected SHA256 digests of the bundled binaries, checked with --verify.
+# None means no digest is pinned yet; update these when upgrading binaries/.
+KNOWN_BINARIES = {
+    "ffmpeg.exe": None,
+    "yt-dlp.exe": None,
+}
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 
-def check_executable(command, name):
-    """Check if an executable is available in PATH."""
+# Required files as (section, name, path, kind); kind selects the check used
+CHECKS = [
+    ("Executables", "PyInstaller", PROJECT_ROOT / ".venv" / "Scripts" / "pyinstaller.exe", "file"),
+    ("Executables", "yt-dlp", PROJECT_ROOT / "binaries" / "yt-dlp.exe", "binary"),
+    ("Executables", "ffmpeg", PROJECT_ROOT / "binaries" / "ffmpeg.exe", "binary"),
+    ("Source files", "Main script", PROJECT_ROOT / "src" / "main.py", "file"),
+    ("Source files", "Icon", PROJECT_ROOT / "src" / "assets" / "icon.ico", "file"),
+    ("Source files", "Logo", PROJECT_ROOT / "src" / "assets" / "logo.png", "file"),
+    ("Build scripts", "Build script", PROJECT_ROOT / "scripts" / "build" / "build.py", "file"),
+    ("Build scripts", "PyInstaller spec", PROJECT_ROOT / "scripts" / "build" / "downly.spec", "file"),
+    ("Build scripts", "Installer build script", PROJECT_ROOT / "scripts" / "installer" / "build_installer.py", "file"),
+    ("Build scripts", "Inno Setup script", PROJECT_ROOT / "scripts" / "installer" / "downly_installer.iss", "file"),
+]
+
+# Inno Setup is only needed for the installer, so it doesn't affect the result
+ISSC_PATH = os.path.expanduser(r"~\Desktop\Coding\InnoSetup\ISCC.exe")
+
+def list_dir_names(path):
+    """Return the set of entry names in a directory, or None if it can't be read."""
     try:
-        subprocess.run([command, "--version"], capture_output=True, check=True)
-        print(f"✓ {name}: Available in PATH")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print(f"✗ {name}: Not available in PATH")
-        return False
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return None
 
-def main():
-    """Main dependency checking function."""
-    print("Downly Build Dependencies Check")
-    print("=" * 40)
-    
-    project_root = Path(__file__).parent.parent.parent
-    all_good = True
+def file_in_listing(path, dir_listing):
+    """Check a path against its parent's listing, falling back to the filesystem."""
+    if dir_listing is None:
+        return os.path.exists(path)
+    return os.path.basename(path) in dir_listing
+
+def check_file_exists(path, name, dir_listing=None):
+    """Check if a file exists and return the result.
     
-    # Check Python environment
-    print(f"\nPython version: {sys.version}")
-    venv_path = project_root / ".venv"
-    if venv_path.exists():
-        print(f"✓ Virtual environment: Found at {venv_path}")
+    dir_listing is the set of names in the file's parent directory (from
+    list_dir_names); when omitted the file is stat'ed directly.
+    """
+    if file_in_listing(path, dir_listing):
+        return CheckResult(True, f"✓ {name}: Found at {path}")
     else:
-        print(f"✗ Virtual environment: Missing at {venv_path}")
-        all_good = False
+        return CheckResult(False, f"✗ {name}: Missing at {path}")
+
+def file_sha256(path):
+    """Return the SHA256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def check_binary(path, name, dir_listing=None, verify=False):
+    """Check a bundled binary exists, optionally verifying its SHA256."""
+    if not file_in_listing(path, dir_listing):
+        return CheckResult(False, f"✗ {name}: Missing at {path}")
     
-    # Check required executables
-    print("\nExecutables:")
-    pyinstaller_path = project_root / ".venv" / "Scripts" / "pyinstaller.exe"
-    all_good &= check_file_exists(pyinstaller_path, "PyInstaller")
+    if verify:
+        expected = KNOWN_BINARIES.get(os.path.basename(path))
+        actual = file_sha256(path)
+        if expected is None:
+            return CheckResult(True, f"✓ {name}: Found at {path} (sha256 {actual}, no pinned digest)")
+        if actual != expected:
+            return CheckResult(False, f"✗ {name}: SHA256 mismatch at {path} (got {actual})")
+        return CheckResult(True, f"✓ {name}: Found at {path} (sha256 verified)")
     
-    ytdlp_path = project_root / "binaries" / "yt-dlp.exe"
-    all_good &= check_file_exists(ytdlp_path, "yt-dlp")
+    return CheckResult(True, f"✓ {name}: Found at {path}")
+
+def check_executable(command, name, verify_version=False):
+    """Check if an executable is available in PATH.
     
-    ffmpeg_path = project_root / "binaries" / "ffmpeg.exe"
-    all_good &= check_file_exists(ffmpeg_path, "ffmpeg")
+    Uses a PATH lookup by default; pass verify_version=True to also run
+    `command --version` and confirm the executable actually starts.
+    """
+    if shutil.which(command) is None:
+        return CheckResult(False, f"✗ {name}: Not available in PATH")
     
-    # Check source files
-    print("\nSource files:")
-    main_script = project_root / "src" / "main.py"
-    all_good &= check_file_exists(main_script, "Main script")
+    if verify_version:
+        try:
+            subprocess.run([command, "--version"], capture_output=True, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return CheckResult(False, f"✗ {name}: Failed to run from PATH")
     
-    icon_path = project_root / "src" / "assets" / "icon.ico"
-    all_good &= check_file_exists(icon_path, "Icon")
+    return CheckResult(True, f"✓ {name}: Available in PATH")
+
+def main(verify=False):
+    """Main dependency checking function."""
+    # Collect the report and write it in one go rather than flushing per line
+    out = ["Downly Build Dependencies Check", "=" * 40]
     
-    logo_path = project_root / "src" / "assets" / "logo.png"
-    all_good &= check_file_exists(logo_path, "Logo")
+    all_good = True
     
-    # Check build scripts
-    print("\nBuild scripts:")
-    build_script = project_root / "scripts" / "build" / "build.py"
-    all_good &= check_file_exists(build_script, "Build script")
+    # Check Python environment
+    out.append(f"\nPython version: {sys.version}")
+    venv_path = PROJECT_ROOT / ".venv"
+    if venv_path.exists():
+        out.append(f"✓ Virtual environment: Found at {venv_path}")
+    else:
+        out.append(f"✗ Virtual environment: Missing at {venv_path}")
+        all_good = False
     
-    installer_script = project_root / "scripts" / "installer" / "build_installer.py"
-    all_good &= check_file_exists(installer_script, "Installer build script")
+    check_functions = {
+        "file": check_file_exists,
+        "binary": partial(check_binary, verify=verify),
+    }
     
-    iss_file = project_root / "scripts" / "installer" / "downly_installer.iss"
-    all_good &= check_file_exists(iss_file, "Inno Setup script")
+    # Run all checks concurrently on a single shared executor
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        # Scan each parent directory once; the checks then become set lookups
+        parents = list({path.parent for _, _, path, _ in CHECKS})
+        listings = dict(zip(parents, executor.map(list_dir_names, parents)))
+        
+        futures = [
+            executor.submit(check_functions[kind], path, name, listings[path.parent])
+            for _, name, path, kind in CHECKS
+        ]
+        optional_future = executor.submit(check_file_exists, ISSC_PATH, "Inno Setup Compiler")
+        
+        # Report in table order, with a header at each new section
+        results = []
+        current_section = None
+        for (section, _, _, _), future in zip(CHECKS, futures):
+            if section != current_section:
+                out.append(f"\n{section}:")
+                current_section = section
+            result = future.result()
+            out.append(result.message)
+            results.append(result)
+        
+        out.append("\nOptional tools:")
+        out.append(optional_future.result().message)
     
-    # Check Inno Setup (if needed for installer)
-    print("\nOptional tools:")
-    issc_path = os.path.expanduser(r"~\Desktop\Coding\InnoSetup\ISCC.exe")
-    check_file_exists(issc_path, "Inno Setup Compiler")
+    all_good = all_good and all(r.ok for r in results)
     
     # Summary
-    print("\n" + "=" * 40)
+    out.append("\n" + "=" * 40)
     if all_good:
-        print("✓ All required dependencies are available!")
-        print("You can proceed with building the application.")
+        out.append("✓ All required dependencies are available!")
+        out.append("You can proceed with building the application.")
     else:
-        print("✗ Some dependencies are missing.")
-        print("Please install missing dependencies before building.")
-        print("\nQuick setup commands:")
-        print("1. Set up virtual environment: python setup/setup_venv.py")
-        print("2. Ensure ffmpeg.exe is in binaries/ folder")
-        print("3. Ensure yt-dlp.exe is in binaries/ folder")
+        out.append("✗ Some dependencies are missing.")
+        out.append("Please install missing dependencies before building.")
+        out.append("\nQuick setup commands:")
+        out.append("1. Set up virtual environment: python setup/setup_venv.py")
+        out.append("2. Ensure ffmpeg.exe is in binaries/ folder")
+        out.append("3. Ensure yt-dlp.exe is in binaries/ folder")
     
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
     return all_good
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Check Downly build dependencies")
+    parser.add_argument("--verify", action="store_true", help="Verify SHA256 digests of the bundled binaries")
+    args = parser.parse_args()
+    
+    success = main(verify=args.verify)
     sys.exit(0 if success else 1)
@@ -8,9 +8,20 @@ import os
 import sys
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+def scan_installers(installer_dir):
+    """Return DirEntry objects for the .exe files in the installer directory."""
+    with os.scandir(installer_dir) as entries:
+        return [entry for entry in entries if entry.name.endswith(".exe") and entry.is_file()]
+
+def copy_release_file(src, dst):
+    """Copy a release artifact using the platform's fast file copy, then its metadata."""
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
 def main():
     """Main release management function."""
     parser = argparse.ArgumentParser(description="Manage Downly releases")
@@ -36,8 +47,11 @@ def main():
         # Check portable builds
         if portable_dir.exists():
             portable_exe = portable_dir / "downly" / "downly.exe"
-            if portable_exe.exists():
+            try:
                 stat = portable_exe.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat is not None:
                 size_mb = stat.st_size / (1024 * 1024)
                 modified = datetime.fromtimestamp(stat.st_mtime)
                 print(f"✓ Portable: {portable_exe} ({size_mb:.1f} MB, {modified.strftime('%Y-%m-%d %H:%M')})")
@@ -48,7 +62,7 @@ def main():
         
         # Check installer builds
         if installer_dir.exists():
-            installer_files = list(installer_dir.glob("*.exe"))
+            installer_files = scan_installers(installer_dir)
             if installer_files:
                 for installer in installer_files:
                     stat = installer.stat()
@@ -94,58 +108,60 @@ def main():
         version_dir = releases_dir / version
         version_dir.mkdir(parents=True, exist_ok=True)
         
-        copied_files = []
+        # Collect copy tasks as (label, source, release name)
+        copy_tasks = []
         
-        # Copy portable build
+        # Portable build
         if portable_dir.exists():
             portable_exe = portable_dir / "downly" / "downly.exe"
             if portable_exe.exists():
-                portable_release_name = f"Downly-{version}-Portable.exe"
-                portable_dest = version_dir / portable_release_name
-                try:
-                    shutil.copy2(portable_exe, portable_dest)
-                    print(f"✓ Copied portable: {portable_release_name}")
-                    copied_files.append(portable_release_name)
-                except Exception as e:
-                    print(f"✗ Failed to copy portable: {e}")
+                copy_tasks.append(("portable", portable_exe, f"Downly-{version}-Portable.exe"))
             else:
                 print("⚠ Portable build not found, skipping")
         
-        # Copy installer build
+        # Installer build
         if installer_dir.exists():
-            installer_files = list(installer_dir.glob("*.exe"))
+            installer_files = scan_installers(installer_dir)
             if installer_files:
                 latest_installer = max(installer_files, key=lambda x: x.stat().st_mtime)
-                installer_release_name = f"Downly-{version}-Setup.exe"
-                installer_dest = version_dir / installer_release_name
-                try:
-                    shutil.copy2(latest_installer, installer_dest)
-                    print(f"✓ Copied installer: {installer_release_name}")
-                    copied_files.append(installer_release_name)
-                except Exception as e:
-                    print(f"✗ Failed to copy installer: {e}")
+                copy_tasks.append(("installer", latest_installer.path, f"Downly-{version}-Setup.exe"))
             else:
                 print("⚠ Installer build not found, skipping")
         
+        # Copy the artifacts concurrently; each copy's failure is reported on its own
+        copied_files = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(copy_release_file, src, version_dir / release_name)
+                for _, src, release_name in copy_tasks
+            ]
+            for (label, _, release_name), future in zip(copy_tasks, futures):
+                try:
+                    future.result()
+                    print(f"✓ Copied {label}: {release_name}")
+                    copied_files.append(release_name)
+                except Exception as e:
+                    print(f"✗ Failed to copy {label}: {e}")
+        
         if copied_files:
             print(f"\n✓ Release {version} created successfully!")
             print(f"Location: {version_dir}")
             print("Files:")
+            sizes_mb = {file: (version_dir / file).stat().st_size / (1024 * 1024) for file in copied_files}
             for file in copied_files:
-                file_path = version_dir / file
-                size_mb = file_path.stat().st_size / (1024 * 1024)
-                print(f"  - {file} ({size_mb:.1f} MB)")
+                print(f"  - {file} ({sizes_mb[file]:.1f} MB)")
             
             # Create a simple release info file
             info_file = version_dir / "release-info.txt"
+            info_lines = [
+                f"Downly Release {version}",
+                f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                f"Files: {len(copied_files)}",
+                "",
+            ]
+            info_lines.extend(f"{file} ({sizes_mb[file]:.1f} MB)" for file in copied_files)
             with open(info_file, 'w') as f:
-                f.write(f"Downly Release {version}\n")
-                f.write(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Files: {len(copied_files)}\n\n")
-                for file in copied_files:
-                    file_path = version_dir / file
-                    size_mb = file_path.stat().st_size / (1024 * 1024)
-                    f.write(f"{file} ({size_mb:.1f} MB)\n")
+                f.write("\n".join(info_lines) + "\n")
             
             print(f"✓ Release info saved to: {info_file.name}")
             
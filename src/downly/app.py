@@ -7,9 +7,13 @@
 # =====
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import os
 import sys
+import logging
+import queue
+import threading
+from typing import Callable, Optional
 
 from .config import AppConfig
 from .core.dependency_manager import DependencyManager
@@ -22,6 +26,14 @@ from .ui.url_input import URLInput
 from .ui.settings_panel import SettingsPanel
 from .ui.progress_panel import ProgressPanel
 
+logger = logging.getLogger(__name__)
+
+
+def _messagebox():
+    """Import tkinter.messagebox on first use; it isn't needed to show the window."""
+    from tkinter import messagebox
+    return messagebox
+
 
 class DownlyApplication(tk.Tk):
     """
@@ -29,18 +41,33 @@ class DownlyApplication(tk.Tk):
     Orchestrates all components and manages application state.
     """
     
-    def __init__(self):
-        """Initialize the main application."""
+    def __init__(self, dependency_manager: Optional[DependencyManager] = None):
+        """
+        Initialize the main application.
+        
+        Args:
+            dependency_manager: Already validated dependency manager whose resolved
+                executable paths are reused; a new one is created if omitted
+        """
         super().__init__()
         
         # Initialize core managers
-        self.dependency_manager = DependencyManager()
+        self.dependency_manager = dependency_manager or DependencyManager()
         self.url_validator = URLValidator()
         self.download_engine = DownloadEngine(self.dependency_manager)
         self.preset_manager = PresetManager()
         
         # Application state
         self.is_downloading = False
+        self.is_closing = False
+        
+        # Download engine events, produced on worker threads and consumed on the Tk main loop
+        self._ui_events: queue.Queue = queue.Queue()
+        self._ui_poll_timer: Optional[str] = None
+        
+        # Only the latest progress update matters, so workers overwrite a single slot
+        self._progress_lock = threading.Lock()
+        self._pending_progress: Optional[tuple] = None
         
         self._setup_window()
         self._setup_style()
@@ -71,7 +98,14 @@ class DownlyApplication(tk.Tk):
         self.style.theme_use('clam')
         
         self.style_manager = StyleManager(self.style)
-        self.style_manager.configure_all_styles()
+        self.style_manager.configure_critical_styles()
+        
+        # Defer the remaining styles so the window renders first
+        self.after_idle(self._setup_secondary_styles)
+    
+    def _setup_secondary_styles(self) -> None:
+        """Apply widget styles that are not needed for the first paint."""
+        self.style_manager.configure_secondary_styles()
         self.style_manager.configure_dropdown_listbox(self)
     
     def _set_window_icon(self) -> None:
@@ -80,7 +114,7 @@ class DownlyApplication(tk.Tk):
             icon_path = self.dependency_manager.get_resource_path("assets/icon.ico")
             self.iconbitmap(icon_path)
         except Exception as e:
-            print(f"Could not load window icon: {e}")
+            logger.warning("Could not load window icon: %s", e)
     
     def _create_components(self) -> None:
         """Create and initialize UI components."""
@@ -107,21 +141,54 @@ class DownlyApplication(tk.Tk):
             on_cancel=self._on_cancel_click
         )
         
-        # Download engine callbacks
+        # Download engine callbacks run on worker threads; route them to the main loop
         self.download_engine.set_callbacks(
-            on_progress=self._on_download_progress,
-            on_success=self._on_download_success,
-            on_error=self._on_download_error,
-            on_status_update=self._on_status_update
+            on_progress=self._queue_progress,
+            on_success=self._from_worker(self._on_download_success),
+            on_error=self._from_worker(self._on_download_error),
+            on_status_update=self._from_worker(self._on_status_update)
         )
     
+    def _from_worker(self, handler: Callable) -> Callable:
+        """Wrap a UI handler so worker threads queue the call instead of touching Tk."""
+        return lambda *args: self._ui_events.put((handler, args))
+    
+    def _queue_progress(self, *args) -> None:
+        """Store the latest progress update from a worker, replacing any not yet shown."""
+        with self._progress_lock:
+            self._pending_progress = args
+    
+    def _start_ui_polling(self) -> None:
+        """Start draining download events if not already running."""
+        if self._ui_poll_timer is None:
+            self._ui_poll_timer = self.after(AppConfig.UI_POLL_INTERVAL, self._process_ui_events)
+    
+    def _process_ui_events(self) -> None:
+        """Apply a batch of queued download events on the Tk main loop."""
+        self._ui_poll_timer = None
+        with self._progress_lock:
+            progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            self._on_download_progress(*progress)
+        
+        for _ in range(AppConfig.UI_EVENTS_PER_TICK):
+            try:
+                handler, args = self._ui_events.get_nowait()
+            except queue.Empty:
+                break
+            handler(*args)
+        
+        # Keep polling while a download is running or updates are still pending
+        if self.is_downloading or not self._ui_events.empty() or self._pending_progress is not None:
+            self._start_ui_polling()
+    
     def _on_url_change(self, url: str) -> None:
         """Handle URL input changes for validation feedback."""
         if not url:
             self.url_input.set_validation_style(None)
             return
         
-        is_valid = self.url_validator.is_valid_youtube_url(url)
+        is_valid = self.url_validator.are_valid_youtube_urls(url)
         self.url_input.set_validation_style(is_valid)
     
     def _on_download_click(self) -> None:
@@ -134,7 +201,7 @@ class DownlyApplication(tk.Tk):
         is_valid, error_message = self.url_validator.validate_url_input(url)
         
         if not is_valid:
-            messagebox.showerror("Invalid URL", error_message)
+            _messagebox().showerror("Invalid URL", error_message)
             return
         
         # Get settings
@@ -143,6 +210,7 @@ class DownlyApplication(tk.Tk):
         # Create download settings object
         settings = DownloadSettings()
         settings.url = url
+        settings.urls = self.url_validator.split_urls(url)
         settings.format = settings_dict["format"]
         settings.video_quality = settings_dict["video_quality"]
         settings.audio_quality = settings_dict["audio_quality"]
@@ -158,7 +226,10 @@ class DownlyApplication(tk.Tk):
             self.is_downloading = True
             self.progress_panel.start_download()
         else:
-            messagebox.showerror("Download Error", "Failed to start download. Please try again.")
+            _messagebox().showerror("Download Error", "Failed to start download. Please try again.")
+        
+        # Also drains any error queued while the download was being rejected
+        self._start_ui_polling()
     
     def _on_cancel_click(self) -> None:
         """Handle cancel button click."""
@@ -170,12 +241,12 @@ class DownlyApplication(tk.Tk):
         self.progress_panel.set_status("Cancelling download...")
         
         # Update UI after a short delay
-        self.after(100, lambda: self.progress_panel.set_status("Download cancelled"))
+        self.after(100, self.progress_panel.set_status, "Download cancelled")
         self.after(200, self.progress_panel.finish_download)
     
-    def _on_download_progress(self, percent: float, status_line: str, is_audio: bool) -> None:
+    def _on_download_progress(self, percent: float, details: str) -> None:
         """Handle download progress updates."""
-        self.progress_panel.set_progress(percent, status_line, is_audio)
+        self.progress_panel.set_progress(percent, details)
     
     def _on_download_success(self) -> None:
         """Handle successful download completion."""
@@ -184,7 +255,9 @@ class DownlyApplication(tk.Tk):
         
         self.is_downloading = False
         self.progress_panel.set_success()
-        messagebox.showinfo("Success", "Download completed successfully!")
+        # Show the dialog once this event batch is applied and the panel has redrawn;
+        # its nested event loop would otherwise hold up the rest of the batch
+        self.after_idle(_messagebox().showinfo, "Success", "Download completed successfully!")
     
     def _on_download_error(self, error_message: str) -> None:
         """Handle download errors."""
@@ -193,14 +266,19 @@ class DownlyApplication(tk.Tk):
         
         self.is_downloading = False
         self.progress_panel.set_error("Download failed")
-        messagebox.showerror("Download Error", error_message)
+        self.after_idle(_messagebox().showerror, "Download Error", error_message)
     
-    def _on_status_update(self, status: str) -> None:
+    def _on_status_update(self, status: str, percent: Optional[float] = None) -> None:
         """Handle status updates from download engine."""
-        self.progress_panel.set_status(status)
+        self.progress_panel.set_status(status, percent)
     
     def _on_closing(self) -> None:
         """Handle application shutdown."""
+        # Repeated close requests can arrive before the window is gone
+        if self.is_closing:
+            return
+        self.is_closing = True
+        
         if self.is_downloading:
             self.download_engine.cancel_download()
         self.destroy()
@@ -208,6 +286,9 @@ class DownlyApplication(tk.Tk):
 
 def main():
     """Main entry point for the application."""
+    # Per-line download output is logged at DEBUG; keep it quiet by default
+    logging.basicConfig(level=logging.WARNING)
+    
     # Validate dependencies before starting
     dependency_manager = DependencyManager()
     deps_ok, error_msg = dependency_manager.validate_dependencies()
@@ -216,7 +297,7 @@ def main():
         # Show error message in a simple dialog
         root = tk.Tk()
         root.withdraw()  # Hide the main window
-        messagebox.showerror(
+        _messagebox().showerror(
             "Dependency Error", 
             f"Required dependencies are not available:\n\n{error_msg}\n\n"
             "Please ensure the application is properly installed or contact support."
@@ -224,8 +305,8 @@ def main():
         root.destroy()
         sys.exit(1)
     
-    # Start the application
-    app = DownlyApplication()
+    # Start the application, reusing the executable paths resolved during validation
+    app = DownlyApplication(dependency_manager)
     app.mainloop()
 
 
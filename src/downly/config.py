@@ -17,6 +17,13 @@ AUDIO_QUALITY_MAP = {
     "64kbps": "9"
 }
 
+# Placeholder text shown in empty input fields
+URL_PLACEHOLDER = "Paste YouTube link here..."
+TIME_PLACEHOLDER = "HH:MM:SS"
+
+# Video quality choices, highest first
+VIDEO_QUALITIES = ("Highest Video Quality", "2160p", "1440p", "1080p", "720p", "480p", "360p", "240p", "144p")
+
 # YouTube URL patterns for validation
 YOUTUBE_PATTERNS = [
     r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
@@ -53,6 +60,8 @@ class ThemeConfig:
     TEXT_SECONDARY = "#cccccc"
     TEXT_HINT = "#888888"
     ACCENT_BLUE = "#ff0050"
+    ACCENT_BLUE_HOVER = "#e73c7e"
+    ACCENT_BLUE_PRESSED = "#d63384"
     ACCENT_GREEN = "#16a085"
     ACCENT_GREEN_HOVER = "#138d75"
     ACCENT_GREEN_PRESSED = "#117a65"
@@ -61,6 +70,10 @@ class ThemeConfig:
     ACCENT_RED_PRESSED = "#a93226"
     BORDER_COLOR = "#404040"
     BORDER_ACCENT = "#ff0050"
+    DISABLED_BG = "#3a3a3a"
+    DISABLED_BORDER = "#555555"
+    DISABLED_ACCENT = "#666666"
+    DISABLED_TEXT = "#999999"
 
     # Font configuration
     TITLE_FONT = ("Arial", 24, "bold")
@@ -80,6 +93,7 @@ class AppConfig:
     
     # Download settings
     DEFAULT_DOWNLOAD_LOCATION = "Downloads"
+    DEFAULT_DOWNLOAD_DIR = os.path.join(os.path.expanduser("~"), DEFAULT_DOWNLOAD_LOCATION)
     
     # Process settings
     DOWNLOAD_RETRIES = 3
@@ -88,9 +102,10 @@ class AppConfig:
     SOCKET_TIMEOUT = 30
     SLEEP_INTERVAL = 1
     MAX_SLEEP_INTERVAL = 3
-    CONCURRENT_FRAGMENTS = 4
-    BUFFER_SIZE = "16K"
+    CONCURRENT_FRAGMENTS = 8
+    BUFFER_SIZE = "1M"
     
-    # Animation settings
-    ANIMATION_INTERVAL = 1000  # milliseconds
+    # Download events are handed to the Tk main loop and drained in batches
+    UI_POLL_INTERVAL = 50      # milliseconds
+    UI_EVENTS_PER_TICK = 100
     CANCELLATION_TIMEOUT = 5   # seconds
@@ -8,10 +8,111 @@
 
 import os
 import sys
+import shutil
+import functools
 import subprocess
 from typing import Optional, Tuple
 
 
+# Keep console tools from opening a console window when launched on Windows
+CREATE_NO_WINDOW = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# Synthetic input for ffmpeg capability probes, large enough for hardware encoders
+_PROBE_SOURCE = "color=size=256x256:duration=0.1"
+
+
+@functools.lru_cache(maxsize=None)
+def _find_on_path(command: str, version_flag: str) -> Optional[str]:
+    """
+    Locate a command on the system PATH, memoized across manager instances.
+    
+    Args:
+        command: Command name to look up (e.g. "ffmpeg")
+        version_flag: Flag used to probe the command if the PATH scan misses it
+        
+    Returns:
+        Resolved executable path, the bare command name if only the probe
+        succeeded, or None if the command is not available
+    """
+    resolved = shutil.which(command)
+    if resolved is not None:
+        return resolved
+    
+    # Fall back to actually running it
+    try:
+        subprocess.run([command, version_flag], capture_output=True, check=True,
+                       creationflags=CREATE_NO_WINDOW)
+        return command
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_ffmpeg(ffmpeg_path: str, args: Tuple[str, ...]) -> bool:
+    """
+    Run a one-frame ffmpeg test job, memoized per binary and arguments.
+    
+    Hardware features such as h264_nvenc are listed by "ffmpeg -encoders" whenever
+    they are compiled in, so an actual test run is used to confirm a usable GPU
+    and driver.
+    
+    Args:
+        ffmpeg_path: Path to ffmpeg executable
+        args: Extra arguments placed before the test input (global options)
+              or after it (output options), as a tuple for hashing
+        
+    Returns:
+        True if the test job succeeded, False otherwise
+    """
+    try:
+        subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-loglevel", "error", *args,
+             "-f", "null", "-"],
+            capture_output=True, check=True, timeout=10, creationflags=CREATE_NO_WINDOW
+        )
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return False
+
+
+# Resolved once at import; none of these change while the app is running.
+_FROZEN = getattr(sys, 'frozen', False)
+# Bundled app: binaries and assets live in _internal next to the executable
+_BUNDLE_DIR = os.path.join(os.path.dirname(sys.executable), "_internal")
+# Development: go up from downly/core to src, then to project root
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PROJECT_ROOT = os.path.dirname(_SRC_DIR)
+_ASSETS_BASE = _BUNDLE_DIR if _FROZEN else _SRC_DIR
+_BASE = os.path.abspath(".")
+
+
+def _candidate_paths(exe_name: str, tool_dir: str) -> tuple:
+    """
+    Build the ordered locations to search for a bundled or local executable.
+    
+    Args:
+        exe_name: Executable file name (e.g. "ffmpeg.exe")
+        tool_dir: Tool-specific fallback subdirectory (e.g. "ffmpeg")
+        
+    Returns:
+        Tuple of candidate paths, most preferred first
+    """
+    if _FROZEN:
+        preferred = (os.path.join(_BUNDLE_DIR, exe_name),)
+    else:
+        preferred = (
+            os.path.join(_PROJECT_ROOT, "binaries", exe_name),
+            os.path.join(_PROJECT_ROOT, ".venv", "Scripts", exe_name),
+        )
+    return preferred + (
+        os.path.join(_BASE, exe_name),
+        os.path.join(_BASE, "bin", exe_name),
+        os.path.join(_BASE, "tools", exe_name),
+        os.path.join(_BASE, tool_dir, exe_name),
+        os.path.join(_BASE, "binaries", exe_name),
+    )
+
+
 class DependencyManager:
     """
     Manages external dependencies (ffmpeg, yt-dlp) and their path resolution.
@@ -33,19 +134,10 @@ class DependencyManager:
             Absolute path to the resource
         """
         if relative_path.startswith("assets/"):
-            # Assets are always relative to the script in development, or in _internal in bundled app
-            if getattr(sys, 'frozen', False):
-                # Running in PyInstaller bundle - assets are in _internal directory
-                base_path = os.path.join(os.path.dirname(sys.executable), "_internal")
-            else:
-                # Development environment - assets are in src directory
-                base_path = os.path.dirname(os.path.abspath(__file__))
-                # Go up two levels from downly/core to src
-                base_path = os.path.dirname(os.path.dirname(base_path))
-        else:
-            # Other resources use current directory as base
-            base_path = os.path.abspath(".")
-        return os.path.join(base_path, relative_path)
+            # Assets live in src in development, or in _internal in the bundled app
+            return os.path.join(_ASSETS_BASE, relative_path)
+        # Other resources use current directory as base
+        return os.path.join(_BASE, relative_path)
     
     def get_ffmpeg_path(self) -> Optional[str]:
         """
@@ -54,48 +146,12 @@ class DependencyManager:
         Returns:
             Path to ffmpeg executable or None if not found
         """
-        if self._ffmpeg_path_cache is not None:
-            return self._ffmpeg_path_cache
-            
-        # Check bundled environment
-        if getattr(sys, 'frozen', False):
-            bundled_ffmpeg = os.path.join(os.path.dirname(sys.executable), "_internal", "ffmpeg.exe")
-            if os.path.exists(bundled_ffmpeg):
-                self._ffmpeg_path_cache = bundled_ffmpeg
-                return bundled_ffmpeg
-        else:
-            # Development environment - check binaries folder
-            current_file_path = os.path.abspath(__file__)
-            # Go up from downly/core to src, then to project root
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file_path)))
-            
-            dev_ffmpeg_binaries = os.path.join(project_root, "binaries", "ffmpeg.exe")
-            if os.path.exists(dev_ffmpeg_binaries):
-                self._ffmpeg_path_cache = dev_ffmpeg_binaries
-                return dev_ffmpeg_binaries
-            
-            # Check virtual environment
-            dev_ffmpeg = os.path.join(project_root, ".venv", "Scripts", "ffmpeg.exe")
-            if os.path.exists(dev_ffmpeg):
-                self._ffmpeg_path_cache = dev_ffmpeg
-                return dev_ffmpeg
-
-        # Try various subdirectories as fallback
-        for subdir in [".", "bin", "tools", "ffmpeg", "binaries"]:
-            possible_path = self.get_resource_path(os.path.join(subdir, "ffmpeg.exe"))
-            if os.path.exists(possible_path):
-                self._ffmpeg_path_cache = possible_path
-                return possible_path
-
-        # Try system PATH
-        try:
-            subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-            self._ffmpeg_path_cache = "ffmpeg"
-            return "ffmpeg"
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        return None
+        if self._ffmpeg_path_cache is None:
+            self._ffmpeg_path_cache = next(
+                (p for p in _candidate_paths("ffmpeg.exe", "ffmpeg") if os.path.exists(p)),
+                None
+            ) or _find_on_path("ffmpeg", "-version")
+        return self._ffmpeg_path_cache
     
     def get_ytdlp_path(self) -> Optional[str]:
         """
@@ -104,48 +160,42 @@ class DependencyManager:
         Returns:
             Path to yt-dlp executable or None if not found
         """
-        if self._ytdlp_path_cache is not None:
-            return self._ytdlp_path_cache
-            
-        # Check bundled environment
-        if getattr(sys, 'frozen', False):
-            bundled_ytdlp = os.path.join(os.path.dirname(sys.executable), "_internal", "yt-dlp.exe")
-            if os.path.exists(bundled_ytdlp):
-                self._ytdlp_path_cache = bundled_ytdlp
-                return bundled_ytdlp
-        else:
-            # Development environment - check binaries folder
-            current_file_path = os.path.abspath(__file__)
-            # Go up from downly/core to src, then to project root
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file_path)))
+        if self._ytdlp_path_cache is None:
+            self._ytdlp_path_cache = next(
+                (p for p in _candidate_paths("yt-dlp.exe", "yt-dlp") if os.path.exists(p)),
+                None
+            ) or _find_on_path("yt-dlp", "--version")
+        return self._ytdlp_path_cache
+    
+    def supports_encoder(self, encoder: str) -> bool:
+        """
+        Check whether the located ffmpeg can encode with the given encoder.
+        
+        Args:
+            encoder: ffmpeg encoder name (e.g. "av1_nvenc")
             
-            dev_ytdlp_binaries = os.path.join(project_root, "binaries", "yt-dlp.exe")
-            if os.path.exists(dev_ytdlp_binaries):
-                self._ytdlp_path_cache = dev_ytdlp_binaries
-                return dev_ytdlp_binaries
+        Returns:
+            True if ffmpeg was found and the encoder works on this machine
+        """
+        ffmpeg_path = self.get_ffmpeg_path()
+        return ffmpeg_path is not None and _probe_ffmpeg(
+            ffmpeg_path, ("-f", "lavfi", "-i", _PROBE_SOURCE, "-frames:v", "1", "-c:v", encoder)
+        )
+    
+    def supports_hwaccel(self, device_type: str) -> bool:
+        """
+        Check whether the located ffmpeg can open a hardware device.
+        
+        Args:
+            device_type: ffmpeg hardware device type (e.g. "cuda")
             
-            # Check virtual environment as fallback
-            dev_ytdlp = os.path.join(project_root, ".venv", "Scripts", "yt-dlp.exe")
-            if os.path.exists(dev_ytdlp):
-                self._ytdlp_path_cache = dev_ytdlp
-                return dev_ytdlp
-
-        # Try to find yt-dlp in various subdirectories
-        for subdir in [".", "bin", "tools", "yt-dlp", "binaries"]:
-            possible_path = self.get_resource_path(os.path.join(subdir, "yt-dlp.exe"))
-            if os.path.exists(possible_path):
-                self._ytdlp_path_cache = possible_path
-                return possible_path
-
-        # Try system PATH
-        try:
-            subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True)
-            self._ytdlp_path_cache = "yt-dlp"
-            return "yt-dlp"
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        return None
+        Returns:
+            True if ffmpeg was found and the device initialised on this machine
+        """
+        ffmpeg_path = self.get_ffmpeg_path()
+        return ffmpeg_path is not None and _probe_ffmpeg(
+            ffmpeg_path, ("-init_hw_device", device_type, "-f", "lavfi", "-i", _PROBE_SOURCE, "-frames:v", "1")
+        )
     
     def validate_dependencies(self) -> Tuple[bool, str]:
         """
@@ -164,12 +214,12 @@ class DependencyManager:
             else:
                 try:
                     if ffmpeg_path == "ffmpeg":
-                        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True, timeout=10, text=True)
+                        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True, timeout=10, text=True, creationflags=CREATE_NO_WINDOW)
                     else:
                         if not os.path.exists(ffmpeg_path):
                             issues.append("ffmpeg executable not found at expected location")
                         else:
-                            result = subprocess.run([ffmpeg_path, "-version"], capture_output=True, check=True, timeout=10, text=True)
+                            result = subprocess.run([ffmpeg_path, "-version"], capture_output=True, check=True, timeout=10, text=True, creationflags=CREATE_NO_WINDOW)
                 except subprocess.CalledProcessError as e:
                     issues.append(f"ffmpeg failed to run (exit code {e.returncode})")
                     if e.stderr:
@@ -188,12 +238,12 @@ class DependencyManager:
             else:
                 try:
                     if ytdlp_path == "yt-dlp":
-                        result = subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True, timeout=10, text=True)
+                        result = subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True, timeout=10, text=True, creationflags=CREATE_NO_WINDOW)
                     else:
                         if not os.path.exists(ytdlp_path):
                             issues.append("yt-dlp executable not found at expected location")
                         else:
-                            result = subprocess.run([ytdlp_path, "--version"], capture_output=True, check=True, timeout=10, text=True)
+                            result = subprocess.run([ytdlp_path, "--version"], capture_output=True, check=True, timeout=10, text=True, creationflags=CREATE_NO_WINDOW)
                 except subprocess.CalledProcessError as e:
                     issues.append(f"yt-dlp failed to run (exit code {e.returncode})")
                     if e.stderr:
@@ -220,3 +270,5 @@ class DependencyManager:
         """Clear cached paths (useful for testing or after system changes)."""
         self._ffmpeg_path_cache = None
         self._ytdlp_path_cache = None
+        _find_on_path.cache_clear()
+        _probe_ffmpeg.cache_clear()
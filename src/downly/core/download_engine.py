@@ -6,23 +6,123 @@
 #
 # =====
 
-import os
 import subprocess
 import threading
-import queue
-import time
 import re
-from typing import Optional, List, Callable, Dict, Any
-from ..config import AUDIO_QUALITY_MAP, AppConfig
-from ..core.dependency_manager import DependencyManager
+import logging
+from typing import Optional, List, Callable, Dict, Any, Tuple
+from ..config import AUDIO_QUALITY_MAP, VIDEO_QUALITIES, AppConfig
+from ..core.dependency_manager import DependencyManager, CREATE_NO_WINDOW
 from ..utils.time_utils import TimeValidator, FilenameUtils
 
+logger = logging.getLogger(__name__)
+
+
+def _build_video_format_string(container: str, quality_selection: str) -> str:
+    """
+    Build a yt-dlp format selector for a video download.
+    
+    Args:
+        container: "mp4" to prefer MP4/M4A streams, anything else for no preference
+        quality_selection: Video quality label (e.g. "720p" or "Highest Video Quality")
+        
+    Returns:
+        yt-dlp format selector string
+    """
+    if quality_selection == "Highest Video Quality":
+        # Use codec-aware format selection for better compatibility
+        if container == "mp4":
+            return "bestvideo*[ext=mp4]+bestaudio[ext=m4a]/bestvideo*+bestaudio[ext=m4a]/bestvideo*+bestaudio/best"
+        return "bestvideo*+bestaudio/best"
+    
+    height = quality_selection.replace('p', '')
+    if container == "mp4":
+        return f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<={height}]+bestaudio[ext=m4a]/bestvideo[height<={height}]+bestaudio/best[height<={height}]"
+    return f"bestvideo[height<={height}]+bestaudio/best[height<={height}]"
+
+
+# Format selectors for every (container, quality) pair, built once at import.
+# WebM and other formats share the container-agnostic selectors.
+_VIDEO_FORMAT_STRINGS = {
+    (container, quality): _build_video_format_string(container, quality)
+    for container in ("mp4", "other")
+    for quality in VIDEO_QUALITIES
+}
+
+
+# Machine-readable progress lines: downloaded, total and estimated total bytes,
+# then the ETA and speed as yt-dlp formats them, separated by tabs
+_PROGRESS_PREFIX = "downly-progress:"
+_PROGRESS_TEMPLATE = (
+    "download:" + _PROGRESS_PREFIX
+    + "%(progress.downloaded_bytes)s\t%(progress.total_bytes)s\t%(progress.total_bytes_estimate)s"
+    + "\t%(progress._eta_str)s\t%(progress._speed_str)s"
+)
+
+# Playlist progress: "[download] Downloading item 2 of 5"
+_PLAYLIST_ITEM_RE = re.compile(r'\[download\] Downloading item (\d+) of (\d+)')
+
+# yt-dlp postprocessors that write the final audio/video streams
+_ENCODING_POSTPROCESSORS = ("Merger", "VideoRemuxer")
+
+# Output line tags of yt-dlp steps that run ffmpeg over the downloaded file
+_FFMPEG_TAGS = frozenset(("[ffmpeg]", "[VideoRemuxer]", "[VideoConvertor]"))
+
+# yt-dlp options shared by every download
+_BASE_ARGS = (
+    "--progress",
+    "--newline",
+    "--no-colors",
+    "--progress-template", _PROGRESS_TEMPLATE,
+    "--no-part",
+    "--no-overwrites",
+    
+    # Network and reliability flags
+    "--retries", str(AppConfig.DOWNLOAD_RETRIES),
+    "--fragment-retries", str(AppConfig.FRAGMENT_RETRIES),
+    "--retry-sleep", str(AppConfig.RETRY_SLEEP),
+    "--socket-timeout", str(AppConfig.SOCKET_TIMEOUT),
+    
+    # Error handling and logging
+    "--no-warnings",
+    "--ignore-errors",
+    "--abort-on-unavailable-fragment",
+    
+    # Add format merging safety flags
+    "--no-post-overwrites",
+    "--prefer-ffmpeg",
+    
+    # Security and safety
+    "--geo-bypass",
+    "--no-check-certificate",
+    
+    # Performance optimization
+    "--concurrent-fragments", str(AppConfig.CONCURRENT_FRAGMENTS),
+    "--buffer-size", AppConfig.BUFFER_SIZE,
+    
+    # Fetch HLS fragments with yt-dlp's own (concurrent) downloader instead of
+    # handing the stream to ffmpeg, and keep ffmpeg's per-frame stats off the pipe
+    "--downloader", "m3u8:native",
+    "--downloader-args", "ffmpeg:-nostats"
+)
+
+_METADATA_ARGS = ("--write-info-json", "--write-description", "--write-thumbnail", "--embed-metadata")
+_NO_METADATA_ARGS = ("--no-write-info-json", "--no-write-description", "--no-write-thumbnail")
+_SUBTITLE_ARGS = ("--write-subs", "--write-auto-subs", "--embed-subs")
+
+# Rate limiting between items; only added when a run downloads more than one video
+_SLEEP_ARGS = (
+    "--sleep-interval", str(AppConfig.SLEEP_INTERVAL),
+    "--max-sleep-interval", str(AppConfig.MAX_SLEEP_INTERVAL),
+)
+
 
 class DownloadSettings:
     """Data class to hold download configuration settings."""
     
     def __init__(self):
         self.url: str = ""
+        self.urls: List[str] = []  # Several URLs fetched by one yt-dlp run; falls back to url
         self.format: str = "mp4"
         self.video_quality: str = "Highest Video Quality"
         self.audio_quality: str = "Highest Audio Quality"
@@ -52,11 +152,18 @@ class DownloadEngine:
         self.download_thread: Optional[threading.Thread] = None
         self.is_downloading: bool = False
         
+        # Item tracking when one yt-dlp run fetches several URLs
+        self.total_items: int = 1
+        self.current_item: int = 0
+        
+        # Set once an audio file is fully downloaded; its progress is final until the next file
+        self.is_audio_finishing: bool = False
+        
         # Callbacks for UI updates
-        self.on_progress: Optional[Callable[[float, str, bool], None]] = None
+        self.on_progress: Optional[Callable[[float, str], None]] = None
         self.on_success: Optional[Callable[[], None]] = None
         self.on_error: Optional[Callable[[str], None]] = None
-        self.on_status_update: Optional[Callable[[str], None]] = None
+        self.on_status_update: Optional[Callable[..., None]] = None
     
     def set_callbacks(self, on_progress: Callable = None, on_success: Callable = None,
                      on_error: Callable = None, on_status_update: Callable = None) -> None:
@@ -64,10 +171,12 @@ class DownloadEngine:
         Set callback functions for download events.
         
         Args:
-            on_progress: Called with (percent, status_line, is_audio)
+            on_progress: Called with (percent, details); details is
+                         display-ready ETA/speed text, possibly empty
             on_success: Called when download completes successfully
             on_error: Called with error message string
-            on_status_update: Called with status string updates
+            on_status_update: Called with a status string, plus a progress percentage
+                              when the step also moves the progress bar
         """
         self.on_progress = on_progress
         self.on_success = on_success
@@ -107,6 +216,9 @@ class DownloadEngine:
             return False
         
         # Start download thread
+        self.total_items = len(settings.urls) or 1
+        self.current_item = 0
+        self.is_audio_finishing = False
         self.is_downloading = True
         self.download_thread = threading.Thread(
             target=self._download_worker_with_fallback, 
@@ -126,31 +238,35 @@ class DownloadEngine:
             # Set cancellation flag first
             self.is_downloading = False
             
-            # Schedule process termination on background thread
-            def terminate_process():
-                try:
-                    if self.download_process and self.download_process.poll() is None:
-                        self.download_process.terminate()
-                        
-                        # Wait for graceful termination
-                        for _ in range(10):  # Wait up to 1 second
-                            if self.download_process.poll() is not None:
-                                break
-                            time.sleep(0.1)
-                        
-                        # Force kill if still running
-                        if self.download_process.poll() is None:
-                            self.download_process.kill()
-                except Exception as e:
-                    print(f"Error terminating process: {e}")
+            # terminate() only sends the signal, so it's safe on the UI thread; the
+            # worker sees the output end and escalates to kill() if needed
+            process = self.download_process
+            if process and process.poll() is None:
+                process.terminate()
             
-            # Start termination in background thread
-            termination_thread = threading.Thread(target=terminate_process)
-            termination_thread.daemon = True
-            termination_thread.start()
+        except Exception as e:
+            logger.warning("Error cancelling download: %s", e)
+    
+    @staticmethod
+    def _terminate_process(process: subprocess.Popen) -> None:
+        """
+        Terminate a download process, killing it if it doesn't exit promptly.
+        
+        Args:
+            process: Process to stop
+        """
+        try:
+            if process.poll() is None:
+                process.terminate()
             
+            # Wait up to 1 second for graceful termination, then force kill
+            try:
+                process.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait(timeout=AppConfig.CANCELLATION_TIMEOUT)
         except Exception as e:
-            print(f"Error cancelling download: {e}")
+            logger.warning("Error terminating process: %s", e)
     
     def _download_worker(self, settings: DownloadSettings, ffmpeg_path: str, 
                         ytdlp_path: str, start_seconds: Optional[int], 
@@ -168,23 +284,15 @@ class DownloadEngine:
         try:
             # Build command
             command = self._build_command(settings, ffmpeg_path, ytdlp_path, start_seconds, end_seconds)
-            print("yt-dlp command:", " ".join(command))
+            logger.debug("yt-dlp command: %s", command)
             
             # Execute download
-            self._execute_download(command, settings.format in ["mp3", "m4a"], start_seconds, end_seconds)
+            self._execute_download(command, settings.format in ["mp3", "m4a"], start_seconds, end_seconds,
+                                   self._get_batch_input(settings))
             
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Unexpected error: {str(e)}")
-        finally:
-            # Ensure process cleanup
-            if hasattr(self, 'download_process') and self.download_process:
-                try:
-                    if self.download_process.poll() is None:
-                        self.download_process.terminate()
-                        self.download_process.wait(timeout=AppConfig.CANCELLATION_TIMEOUT)
-                except Exception:
-                    pass
     
     def _download_worker_with_fallback(self, settings: DownloadSettings, ffmpeg_path: str, 
                                      ytdlp_path: str, start_seconds: Optional[int], 
@@ -202,10 +310,12 @@ class DownloadEngine:
         try:
             # Try with original format first
             command = self._build_command(settings, ffmpeg_path, ytdlp_path, start_seconds, end_seconds)
-            print("yt-dlp command:", " ".join(command))
+            logger.debug("yt-dlp command: %s", command)
             
             # Execute download
-            success = self._execute_download_safe(command, settings.format in ["mp3", "m4a"], start_seconds, end_seconds)
+            batch_input = self._get_batch_input(settings)
+            success = self._execute_download_safe(command, settings.format in ["mp3", "m4a"], start_seconds, end_seconds,
+                                                  batch_input)
             
             # If failed and format was webm, try with mp4 fallback
             if not success and settings.format == "webm" and not (settings.format in ["mp3", "m4a"]):
@@ -218,22 +328,13 @@ class DownloadEngine:
                 fallback_settings.format = "mp4"
                 
                 fallback_command = self._build_command(fallback_settings, ffmpeg_path, ytdlp_path, start_seconds, end_seconds)
-                print("yt-dlp fallback command:", " ".join(fallback_command))
+                logger.debug("yt-dlp fallback command: %s", fallback_command)
                 
-                self._execute_download_safe(fallback_command, False, start_seconds, end_seconds)
+                self._execute_download_safe(fallback_command, False, start_seconds, end_seconds, batch_input)
             
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Unexpected error: {str(e)}")
-        finally:
-            # Ensure process cleanup
-            if hasattr(self, 'download_process') and self.download_process:
-                try:
-                    if self.download_process.poll() is None:
-                        self.download_process.terminate()
-                        self.download_process.wait(timeout=AppConfig.CANCELLATION_TIMEOUT)
-                except Exception:
-                    pass
     
     def _build_command(self, settings: DownloadSettings, ffmpeg_path: str, 
                       ytdlp_path: str, start_seconds: Optional[int], 
@@ -251,86 +352,69 @@ class DownloadEngine:
         Returns:
             Complete command list for subprocess
         """
-        downloads_folder = settings.download_location or os.path.join(os.path.expanduser("~"), AppConfig.DEFAULT_DOWNLOAD_LOCATION)
+        downloads_folder = settings.download_location or AppConfig.DEFAULT_DOWNLOAD_DIR
         
         # Build base command
         command = [
             ytdlp_path,
             "-P", downloads_folder,
             "--ffmpeg-location", ffmpeg_path,
-            "--progress",
-            "--no-part",
-            "--no-overwrites",
-            
-            # Network and reliability flags
-            "--retries", str(AppConfig.DOWNLOAD_RETRIES),
-            "--fragment-retries", str(AppConfig.FRAGMENT_RETRIES),
-            "--retry-sleep", str(AppConfig.RETRY_SLEEP),
-            "--socket-timeout", str(AppConfig.SOCKET_TIMEOUT),
-            
-            # User agent and rate limiting
-            "--sleep-interval", str(AppConfig.SLEEP_INTERVAL),
-            "--max-sleep-interval", str(AppConfig.MAX_SLEEP_INTERVAL),
-            
-            # Error handling and logging
-            "--no-warnings",
-            "--ignore-errors",
-            "--abort-on-unavailable-fragment",
-            
-        # Add format selection safety
-        "--check-formats",
-        
-        # Add format merging safety flags
-        "--no-post-overwrites",
-        "--prefer-ffmpeg",
-        
-        # Security and safety
-        "--geo-bypass",
-        "--no-check-certificate",            # Performance optimization
-            "--concurrent-fragments", str(AppConfig.CONCURRENT_FRAGMENTS),
-            "--buffer-size", AppConfig.BUFFER_SIZE
+            *_BASE_ARGS
         ]
         
         # Add metadata options
-        if settings.download_metadata:
-            command.extend([
-                "--write-info-json",
-                "--write-description",
-                "--write-thumbnail",
-                "--embed-metadata"
-            ])
-        else:
-            command.extend([
-                "--no-write-info-json",
-                "--no-write-description",
-                "--no-write-thumbnail"
-            ])
+        command.extend(_METADATA_ARGS if settings.download_metadata else _NO_METADATA_ARGS)
         
         # Add subtitle options
         if settings.download_subtitles:
-            command.extend([
-                "--write-subs",
-                "--write-auto-subs",
-                "--embed-subs"
-            ])
+            command.extend(_SUBTITLE_ARGS)
         
         # Configure format options
         is_audio_download = settings.format in ["mp3", "m4a"]
         self._add_format_options(command, settings, is_audio_download, start_seconds, end_seconds)
         
+        urls = settings.urls or [settings.url]
+        if len(urls) > 1 or any("list=" in url for url in urls):
+            command.extend(_SLEEP_ARGS)
+        
         # Configure output filename
         if settings.custom_filename:
             safe_filename = FilenameUtils.sanitize_filename(settings.custom_filename)
-            command.extend(["-o", f"{safe_filename}.%(ext)s"])
+            if len(urls) > 1:
+                # Number the files so --no-overwrites doesn't skip all but the first
+                command.extend(["-o", f"{safe_filename} %(autonumber)s.%(ext)s"])
+            else:
+                command.extend(["-o", f"{safe_filename}.%(ext)s"])
         else:
             # Use a safer default filename template
             command.extend(["-o", "%(title)s.%(ext)s", "--restrict-filenames"])
         
-        command.append(settings.url)
+        # One yt-dlp run for every URL saves a process start-up per item; several URLs
+        # are passed on stdin so a long paste can't overflow the command line
+        if len(urls) > 1:
+            command.extend(["--batch-file", "-"])
+        else:
+            command.extend(urls)
         return command
     
+    @staticmethod
+    def _get_batch_input(settings: DownloadSettings) -> Optional[bytes]:
+        """
+        Build the stdin batch file for a download of several URLs.
+        
+        Args:
+            settings: Download configuration
+            
+        Returns:
+            Newline-separated URLs, or None when the URL is on the command line
+        """
+        if len(settings.urls) > 1:
+            return "\n".join(settings.urls).encode("utf-8")
+        return None
+    
     def _execute_download_safe(self, command: List[str], is_audio_download: bool, 
-                              start_seconds: Optional[int], end_seconds: Optional[int]) -> bool:
+                              start_seconds: Optional[int], end_seconds: Optional[int],
+                              batch_input: Optional[bytes] = None) -> bool:
         """
         Execute download with error handling and return success status.
         
@@ -339,15 +423,16 @@ class DownloadEngine:
             is_audio_download: Whether this is an audio download
             start_seconds: Start time in seconds
             end_seconds: End time in seconds
+            batch_input: URLs to write to stdin for "--batch-file -", if any
             
         Returns:
             True if download succeeded, False otherwise
         """
         try:
-            self._execute_download(command, is_audio_download, start_seconds, end_seconds)
+            self._execute_download(command, is_audio_download, start_seconds, end_seconds, batch_input)
             return True
         except Exception as e:
-            print(f"Download attempt failed: {str(e)}")
+            logger.warning("Download attempt failed: %s", e)
             return False
     
     def _add_format_options(self, command: List[str], settings: DownloadSettings, 
@@ -377,7 +462,7 @@ class DownloadEngine:
                 command.extend(["--merge-output-format", "mp4"])
                 command.extend(["--remux-video", "mp4"])
                 # Ensure AAC audio for MP4 compatibility
-                command.extend(["--postprocessor-args", "ffmpeg:-c:a aac -b:a 192k"])
+                self._add_encoding_args(command, "ffmpeg", "-c:a aac -b:a 192k")
                 self._add_audio_quality_option(command, settings.audio_quality)
             
             # Add download sections
@@ -388,42 +473,46 @@ class DownloadEngine:
                 command.extend(["-f", "bestaudio/best", "--extract-audio", "--audio-format", settings.format])
                 self._add_audio_quality_option(command, settings.audio_quality)
             else:
-                # Use simplified format selection for video downloads
-                if settings.video_quality == "Highest Video Quality":
-                    # Use format selection that ensures codec compatibility
-                    if settings.format == "mp4":
-                        # For MP4, prefer AAC audio for better compatibility
-                        command.extend(["-f", "bestvideo*[ext=mp4]+bestaudio[ext=m4a]/bestvideo*+bestaudio[ext=m4a]/bestvideo*+bestaudio/best"])
-                        command.extend(["--merge-output-format", "mp4"])
-                        command.extend(["--remux-video", "mp4"])
-                        # Ensure AAC audio for MP4 compatibility
-                        command.extend(["--postprocessor-args", "ffmpeg:-c:a aac -b:a 192k"])
-                    elif settings.format == "webm":
-                        # For WebM, Opus audio is fine
-                        command.extend(["-f", "bestvideo*+bestaudio/best"])
-                        command.extend(["--merge-output-format", "webm"])
-                    else:
-                        # For other formats, let yt-dlp choose the best completely
-                        # Don't specify -f at all to use yt-dlp's default behavior
-                        pass
-                else:
-                    # Use specific quality selection for non-highest quality
+                # Selectors come from the precomputed table; at highest quality, formats other
+                # than MP4/WebM leave -f unset so yt-dlp's default choice applies
+                is_highest = settings.video_quality == "Highest Video Quality"
+                if settings.format in ("mp4", "webm") or not is_highest:
                     format_str = self._get_video_format_string(settings.format, settings.video_quality)
                     command.extend(["-f", format_str])
-                    
-                    # Add format-specific merging options
-                    if settings.format == "mp4":
-                        command.extend(["--merge-output-format", "mp4"])
-                        command.extend(["--remux-video", "mp4"])
-                        # Ensure AAC audio for MP4 compatibility
-                        command.extend(["--postprocessor-args", "ffmpeg:-c:a aac -b:a 192k"])
-                    elif settings.format == "webm":
-                        command.extend(["--merge-output-format", "webm"])
+                
+                # Add format-specific merging options
+                if settings.format == "mp4":
+                    command.extend(["--merge-output-format", "mp4"])
+                    command.extend(["--remux-video", "mp4"])
+                    # Ensure AAC audio for MP4 compatibility
+                    self._add_encoding_args(command, "ffmpeg", "-c:a aac -b:a 192k")
+                elif settings.format == "webm":
+                    # For WebM at highest quality, the source codecs (e.g. Opus) are kept
+                    command.extend(["--merge-output-format", "webm"])
+                    if not is_highest:
                         # Add webm-specific flags for better compatibility
-                        command.extend(["--postprocessor-args", "ffmpeg:-c:v libvpx-vp9 -c:a libopus"])
+                        self._add_encoding_args(command, "ffmpeg", f"{self._get_webm_video_codec_args()} -c:a libopus")
+                        if self._use_cuda_decoding():
+                            # Decode the video input on NVDEC and keep frames in VRAM for NVENC
+                            self._add_encoding_args(command, "ffmpeg_i1", "-hwaccel cuda -hwaccel_output_format cuda")
                 
                 self._add_audio_quality_option(command, settings.audio_quality)
     
+    def _add_encoding_args(self, command: List[str], executable: str, args: str) -> None:
+        """
+        Add ffmpeg arguments for the postprocessors that produce the output file.
+        
+        Scoping the arguments keeps yt-dlp's later metadata, subtitle and thumbnail
+        passes as stream copies instead of re-encoding the file once per pass.
+        
+        Args:
+            command: Command list to modify
+            executable: yt-dlp executable key (e.g. "ffmpeg" or "ffmpeg_i1" for the first input)
+            args: ffmpeg arguments
+        """
+        for postprocessor in _ENCODING_POSTPROCESSORS:
+            command.extend(["--postprocessor-args", f"{postprocessor}+{executable}:{args}"])
+    
     def _add_audio_quality_option(self, command: List[str], audio_quality: str) -> None:
         """Add audio quality parameter to command if not using highest quality."""
         if audio_quality != "Highest Audio Quality":
@@ -444,42 +533,36 @@ class DownloadEngine:
             end_formatted = TimeValidator.format_seconds_to_time(end_seconds)
             command.extend(["--download-sections", f"*0-{end_formatted}"])
     
+    def _get_webm_video_codec_args(self) -> str:
+        """Choose the ffmpeg video codec arguments for WebM re-encoding."""
+        # AV1 on NVENC is far faster than software VP9; both are valid WebM video
+        if self.dependency_manager.supports_encoder("av1_nvenc"):
+            return "-c:v av1_nvenc -preset p4 -rc vbr -cq 23"
+        # Software VP9: row-based multithreading and a faster speed preset keep all cores busy
+        return "-c:v libvpx-vp9 -row-mt 1 -deadline good -cpu-used 4"
+    
+    def _use_cuda_decoding(self) -> bool:
+        """Whether the WebM re-encode can decode on the GPU as well as encode there."""
+        return (self.dependency_manager.supports_encoder("av1_nvenc")
+                and self.dependency_manager.supports_hwaccel("cuda"))
+    
     def _get_time_section_format_string(self, video_format: str, quality_selection: str) -> str:
         """Generate optimized format string for time-sectioned downloads."""
-        if quality_selection == "Highest Video Quality":
-            # Use codec-compatible format selection for time sections
-            if video_format == "mp4":
-                return "bestvideo*[ext=mp4]+bestaudio[ext=m4a]/bestvideo*+bestaudio[ext=m4a]/bestvideo*+bestaudio/best"
-            else:
-                return "bestvideo*+bestaudio/best"
-        else:
-            height = quality_selection.replace('p', '')
-            if video_format == "mp4":
-                return f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<={height}]+bestaudio[ext=m4a]/bestvideo[height<={height}]+bestaudio/best[height<={height}]"
-            else:
-                return f"bestvideo[height<={height}]+bestaudio/best[height<={height}]"
+        return self._get_video_format_string(video_format, quality_selection)
     
     def _get_video_format_string(self, video_format: str, quality_selection: str) -> str:
         """Generate format string for standard video downloads."""
-        if quality_selection == "Highest Video Quality":
-            # Use codec-aware format selection for better compatibility
-            if video_format == "mp4":
-                return "bestvideo*[ext=mp4]+bestaudio[ext=m4a]/bestvideo*+bestaudio[ext=m4a]/bestvideo*+bestaudio/best"
-            elif video_format == "webm":
-                return "bestvideo*+bestaudio/best"
-            else:
-                return "bestvideo*+bestaudio/best"
-        else:
-            height = quality_selection.replace('p', '')
-            if video_format == "mp4":
-                return f"bestvideo[height<={height}][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<={height}]+bestaudio[ext=m4a]/bestvideo[height<={height}]+bestaudio/best[height<={height}]"
-            elif video_format == "webm":
-                return f"bestvideo[height<={height}]+bestaudio/best[height<={height}]"
-            else:
-                return f"bestvideo[height<={height}]+bestaudio/best[height<={height}]"
+        container = "mp4" if video_format == "mp4" else "other"
+        format_str = _VIDEO_FORMAT_STRINGS.get((container, quality_selection))
+        if format_str is None:
+            # Qualities outside VIDEO_QUALITIES are built once, then reused like the rest
+            format_str = _VIDEO_FORMAT_STRINGS[container, quality_selection] = \
+                _build_video_format_string(container, quality_selection)
+        return format_str
     
     def _execute_download(self, command: List[str], is_audio_download: bool, 
-                         start_seconds: Optional[int], end_seconds: Optional[int]) -> None:
+                         start_seconds: Optional[int], end_seconds: Optional[int],
+                         batch_input: Optional[bytes] = None) -> None:
         """
         Execute the download command and handle output.
         
@@ -488,71 +571,54 @@ class DownloadEngine:
             is_audio_download: Whether this is an audio download
             start_seconds: Start time in seconds
             end_seconds: End time in seconds
+            batch_input: URLs to write to stdin for "--batch-file -", if any
         """
+        process = None
         try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-
-            self.download_process = subprocess.Popen(
+            process = self.download_process = subprocess.Popen(
                 command, 
+                stdin=subprocess.PIPE if batch_input else subprocess.DEVNULL,
                 stdout=subprocess.PIPE, 
                 stderr=subprocess.STDOUT,
-                text=True, 
-                startupinfo=startupinfo, 
-                bufsize=1, 
-                universal_newlines=True
+                creationflags=CREATE_NO_WINDOW
             )
 
+            if batch_input:
+                # yt-dlp reads the whole batch file before it starts downloading
+                try:
+                    process.stdin.write(batch_input)
+                    process.stdin.close()
+                except OSError:
+                    pass  # yt-dlp exited early; its output explains why
+
             if self.on_status_update:
                 self.on_status_update("Starting download...")
 
-            # Create queue for output processing
-            output_queue = queue.Queue()
-            
-            def read_output():
-                try:
-                    for line in iter(self.download_process.stdout.readline, ''):
-                        if line:
-                            output_queue.put(line)
-                        if self.download_process.poll() is not None:
-                            break
-                except:
-                    pass
-                finally:
-                    output_queue.put(None)  # Signal end
+            # Checked once per download instead of on every output line
+            log_output = logger.isEnabledFor(logging.DEBUG)
             
-            # Start output reading thread
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
-            
-            # Process lines with cancellation checks
-            while self.download_process.poll() is None:
-                if not self.is_downloading:
-                    break
-                
-                try:
-                    line = output_queue.get(timeout=0.1)
-                    if line is None:  # End signal
-                        break
-                    line = line.strip()
-                    if line:
-                        print(f"yt-dlp output: {line}")
-                        self._process_download_line(line, is_audio_download, start_seconds, end_seconds)
-                except queue.Empty:
-                    continue
+            # Read output on this worker thread until yt-dlp closes the pipe;
+            # cancelling terminates the process, which ends the read
+            for raw_line in process.stdout:
+                # Stop if cancelled or superseded by a newer download
+                if not self.is_downloading or self.download_process is not process:
+                    return
+                # The pipe is binary: titles in the console code page can't fail the read
+                line = raw_line.strip().decode("utf-8", "replace")
+                if line:
+                    if log_output:
+                        logger.debug("yt-dlp output: %s", line)
+                    self._process_download_line(line, is_audio_download, start_seconds, end_seconds)
 
-            # Check if download was cancelled
-            if not self.is_downloading:
+            process.wait()
+            if not self.is_downloading or self.download_process is not process:
                 return
-                
-            self.download_process.wait()
-            if self.download_process.returncode == 0:
+            
+            if process.returncode == 0:
                 if self.on_success:
                     self.on_success()
             else:
-                error_msg = f"Download failed with return code {self.download_process.returncode}"
+                error_msg = f"Download failed with return code {process.returncode}"
                 if self.on_error:
                     self.on_error(error_msg)
 
@@ -568,50 +634,129 @@ class DownloadEngine:
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Unexpected error: {str(e)}")
+        finally:
+            # Ensure this attempt's process doesn't outlive it
+            if process and process.poll() is None:
+                self._terminate_process(process)
+            if process and process.stdout:
+                process.stdout.close()
+    
+    @staticmethod
+    def _parse_progress_line(line: str) -> Optional[Tuple[float, str]]:
+        """
+        Parse a progress line produced by _PROGRESS_TEMPLATE.
+        
+        Args:
+            line: Output line starting with _PROGRESS_PREFIX
+            
+        Returns:
+            Tuple of (percent, details) where details is e.g. "ETA 01:23 - 1.20MiB/s",
+            or None if the total size is not known yet
+        """
+        fields = line[len(_PROGRESS_PREFIX):].split("\t")
+        if len(fields) < 3:
+            return None
+        downloaded, total, estimate = fields[:3]
+        try:
+            percent = float(downloaded) / float(total if total != "NA" else estimate) * 100
+        except (ValueError, ZeroDivisionError):
+            return None
+        
+        eta = fields[3].strip() if len(fields) > 3 else ""
+        speed = fields[4].strip() if len(fields) > 4 else ""
+        has_eta = eta not in ("", "NA", "Unknown")
+        has_speed = speed not in ("", "NA", "Unknown", "Unknown B/s")
+        
+        # Build the details text with a single format for whichever parts are known
+        if has_eta and has_speed:
+            return percent, f"ETA {eta} - {speed}"
+        if has_eta:
+            return percent, f"ETA {eta}"
+        return percent, speed if has_speed else ""
+    
+    def _report_progress(self, percent: float, details: str, is_audio_download: bool) -> None:
+        """
+        Forward a progress update, switching audio downloads to extraction once complete.
+        
+        Args:
+            percent: Progress percentage
+            details: ETA/speed text, possibly empty
+            is_audio_download: Whether this is an audio download
+        """
+        if self.is_audio_finishing:
+            return
+        if self.on_progress:
+            self.on_progress(percent, details)
+        if is_audio_download and percent >= 100.0:
+            # Audio conversion reports no progress; show one status until the file is done
+            self.is_audio_finishing = True
+            if self.on_status_update:
+                self.on_status_update("Extracting Audio...")
+    
+    def _report_step(self, status: str, percent: float) -> None:
+        """
+        Report a processing step's status and progress together as one UI update.
+        
+        Args:
+            status: Status text to display
+            percent: Progress percentage reached by this step
+        """
+        if self.on_status_update:
+            # Progress is final while an audio file is being extracted
+            self.on_status_update(status, None if self.is_audio_finishing else percent)
     
     def _process_download_line(self, line: str, is_audio_download: bool, 
                              start_seconds: Optional[int], end_seconds: Optional[int]) -> None:
         """Process a single line of output from yt-dlp."""
-        if '[download]' in line:
+        if line.startswith(_PROGRESS_PREFIX):
+            progress = self._parse_progress_line(line)
+            if progress:
+                self._report_progress(progress[0], progress[1], is_audio_download)
+            return
+        
+        # yt-dlp tags its own lines with the extractor or postprocessor name, e.g. "[Merger] ..."
+        tag = line[:line.find(']') + 1] if line.startswith('[') else ""
+
+        if tag == '[download]':
             try:
-                percent_match = re.search(r'(\d+(?:\.\d+)?)%', line)
-                if percent_match:
-                    percent = float(percent_match.group(1))
-                    if self.on_progress:
-                        self.on_progress(percent, line, is_audio_download)
-                elif "ETA" in line:
-                    eta_match = re.search(r'(\d+\.\d+)% of', line)
-                    if eta_match:
-                        percent = float(eta_match.group(1))
-                        if self.on_progress:
-                            self.on_progress(percent, line, is_audio_download)
-                elif "Destination" in line:
+                if "Destination" in line:
+                    # A new file starts downloading, e.g. the next playlist entry
+                    self.is_audio_finishing = False
                     if self.on_status_update:
                         self.on_status_update("Preparing file...")
                 elif "Resuming" in line:
                     if self.on_status_update:
                         self.on_status_update("Resuming download...")
+                else:
+                    # Playlist entries: "[download] Downloading item 2 of 5"
+                    item_match = _PLAYLIST_ITEM_RE.match(line)
+                    if item_match and self.on_status_update:
+                        self.on_status_update(f"Downloading item {item_match.group(1)} of {item_match.group(2)}...")
             except Exception as e:
-                print(f"Progress parsing error: {e} on line: {line}")
+                logger.debug("Progress parsing error: %s on line: %s", e, line)
+
+        elif tag and self.total_items > 1 and line.startswith("Extracting URL", len(tag) + 1):
+            # yt-dlp starts each URL given on the command line with this line
+            self.current_item += 1
+            if self.on_status_update:
+                self.on_status_update(f"Downloading item {self.current_item} of {self.total_items}...")
 
-        elif line.startswith("frame=") or "ffmpeg" in line.lower():
+        elif tag in _FFMPEG_TAGS or line.startswith("frame="):
             if start_seconds is not None or end_seconds is not None:
-                if self.on_status_update:
-                    self.on_status_update("Trimming video...")
+                self._report_step("Trimming video...", 90)
             else:
-                if self.on_status_update:
-                    self.on_status_update("Processing video...")
-            if self.on_progress:
-                self.on_progress(90, line, is_audio_download)
+                self._report_step("Processing video...", 90)
 
-        elif "Merging" in line or "merger" in line.lower():
-            if self.on_status_update:
-                self.on_status_update("Merging audio and video...")
-            if self.on_progress:
-                self.on_progress(95, line, is_audio_download)
+        elif tag == "[Merger]":
+            self._report_step("Merging audio and video...", 95)
+
+        elif tag == "[ExtractAudio]":
+            self._report_progress(100, "", is_audio_download)
 
-        elif "ERROR:" in line.upper():
-            if "conversion failed" in line.lower() or "merger" in line.lower():
+        elif line.startswith("ERROR:"):
+            # Only error lines pay for the case-insensitive check
+            error_text = line.lower()
+            if "conversion failed" in error_text or "merger" in error_text:
                 if self.on_status_update:
                     self.on_status_update("Format conversion error detected...")
             # Let the main error handling deal with the actual error
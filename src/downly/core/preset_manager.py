@@ -6,7 +6,7 @@
 #
 # =====
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from ..config import PRESETS
 
 
@@ -19,6 +19,28 @@ class PresetManager:
     def __init__(self):
         """Initialize preset manager with default presets."""
         self.presets = PRESETS.copy()
+        self._rebuild_lookup()
+    
+    def _rebuild_lookup(self) -> None:
+        """Flatten presets into (format, video quality, audio quality) tuples keyed by (format type, quality)."""
+        self._preset_values: Dict[Tuple[str, str], Tuple[str, str, str]] = {
+            (format_type, quality): (config["format"], config["video_quality"], config["audio_quality"])
+            for format_type, qualities in self.presets.items()
+            for quality, config in qualities.items()
+        }
+    
+    def get_preset_values(self, format_type: str, quality: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Get preset settings as a flat tuple with a single lookup.
+        
+        Args:
+            format_type: Format type ("Video", "Audio", etc.)
+            quality: Quality level ("High", "Standard", "Low")
+            
+        Returns:
+            Tuple of (format, video_quality, audio_quality) or None if not found
+        """
+        return self._preset_values.get((format_type, quality))
     
     def get_preset(self, format_type: str, quality: str) -> Optional[Dict[str, Any]]:
         """
@@ -66,6 +88,7 @@ class PresetManager:
         if format_type not in self.presets:
             self.presets[format_type] = {}
         self.presets[format_type][quality] = config.copy()
+        self._rebuild_lookup()
     
     def remove_preset(self, format_type: str, quality: str) -> bool:
         """
@@ -83,9 +106,11 @@ class PresetManager:
             # Remove format type if no qualities left
             if not self.presets[format_type]:
                 del self.presets[format_type]
+            self._rebuild_lookup()
             return True
         return False
     
     def reset_to_defaults(self) -> None:
         """Reset presets to default configuration."""
         self.presets = PRESETS.copy()
+        self._rebuild_lookup()
@@ -7,8 +7,44 @@
 # =====
 
 import re
-from typing import List
-from ..config import YOUTUBE_PATTERNS
+from typing import List, Optional
+from ..config import URL_PLACEHOLDER, YOUTUBE_PATTERNS
+
+# Optional: google-re2 matches in linear time with no backtracking
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Combine URL patterns into a single case-insensitive alternation.
+    
+    Uses RE2 when it is installed, falling back to the standard re module
+    (also for patterns using syntax RE2 doesn't support, such as lookarounds).
+    
+    Returns:
+        Compiled pattern, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    
+    combined = "(?i)" + "|".join(f"(?:{pattern})" for pattern in patterns)
+    if _re2 is not None:
+        try:
+            return _re2.compile(combined)
+        except Exception:
+            pass
+    return re.compile(combined)
+
+
+# Compiled once at import for the default validator
+_YOUTUBE_RE = _compile_patterns(YOUTUBE_PATTERNS)
+
+# Every default pattern has "youtube." or "youtu.be" within its first characters
+_YOUTUBE_HINT = "youtu"
+_YOUTUBE_HINT_SPAN = 32
 
 
 class URLValidator:
@@ -25,7 +61,12 @@ class URLValidator:
             patterns: List of regex patterns to validate against. 
                      If None, uses default YouTube patterns.
         """
-        self.patterns = patterns or YOUTUBE_PATTERNS
+        if patterns:
+            self.patterns = list(patterns)
+            self._compiled = _compile_patterns(self.patterns)
+        else:
+            self.patterns = list(YOUTUBE_PATTERNS)
+            self._compiled = _YOUTUBE_RE
     
     def is_valid_youtube_url(self, url: str) -> bool:
         """
@@ -43,15 +84,47 @@ class URLValidator:
         url = url.strip()
         if not url:
             return False
+        
+        # Reject obvious non-YouTube input without running the default patterns
+        if self._compiled is _YOUTUBE_RE and _YOUTUBE_HINT not in url[:_YOUTUBE_HINT_SPAN].lower():
+            return False
+            
+        return self._compiled is not None and self._compiled.match(url) is not None
+    
+    @staticmethod
+    def split_urls(text: str) -> List[str]:
+        """
+        Split URL input into individual URLs.
+        
+        URLs never contain whitespace, so any run of spaces or newlines separates them.
+        
+        Args:
+            text: Raw URL input
             
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in self.patterns)
+        Returns:
+            List of URL strings, empty if the input is blank
+        """
+        return text.split() if text else []
     
-    def validate_url_input(self, url: str, placeholder: str = "Paste YouTube link here...") -> tuple[bool, str]:
+    def are_valid_youtube_urls(self, text: str) -> bool:
+        """
+        Check if URL input holds at least one URL and every URL is a YouTube URL.
+        
+        Args:
+            text: Raw URL input, possibly containing several URLs
+            
+        Returns:
+            True if all URLs match a YouTube pattern, False otherwise
+        """
+        urls = self.split_urls(text)
+        return bool(urls) and all(self.is_valid_youtube_url(url) for url in urls)
+    
+    def validate_url_input(self, url: str, placeholder: str = URL_PLACEHOLDER) -> tuple[bool, str]:
         """
         Validate URL input including placeholder handling.
         
         Args:
-            url: URL string to validate
+            url: URL input to validate; may contain several whitespace-separated URLs
             placeholder: Placeholder text to check against
             
         Returns:
@@ -60,7 +133,7 @@ class URLValidator:
         if not url or url.strip() == placeholder:
             return False, "Please enter a YouTube URL before downloading."
         
-        if not self.is_valid_youtube_url(url):
+        if not self.are_valid_youtube_urls(url):
             error_msg = ("Please enter a valid YouTube URL.\n\n"
                         "Supported formats:\n"
                         "• youtube.com/watch?v=...\n"
@@ -80,6 +153,7 @@ class URLValidator:
         """
         if pattern not in self.patterns:
             self.patterns.append(pattern)
+            self._compiled = _compile_patterns(self.patterns)
     
     def remove_pattern(self, pattern: str) -> bool:
         """
@@ -93,6 +167,7 @@ class URLValidator:
         """
         try:
             self.patterns.remove(pattern)
-            return True
         except ValueError:
             return False
+        self._compiled = _compile_patterns(self.patterns)
+        return True
@@ -8,9 +8,11 @@
 
 import tkinter as tk
 from tkinter import ttk
-import os
+import logging
 from ..core.dependency_manager import DependencyManager
 
+logger = logging.getLogger(__name__)
+
 
 class HeaderComponent:
     """
@@ -37,7 +39,9 @@ class HeaderComponent:
         self.logo_image: tk.PhotoImage = None
         
         self._create_widgets()
-        self._load_logo()
+        
+        # Load the logo from disk after the window has been drawn
+        self.header_frame.after_idle(self._load_logo)
     
     def _create_widgets(self) -> None:
         """Create header widgets."""
@@ -58,30 +62,29 @@ class HeaderComponent:
     
     def _load_logo(self) -> None:
         """Load and display logo images with error handling."""
+        logo_path = self.dependency_manager.get_resource_path("assets/logo.png")
         try:
-            logo_path = self.dependency_manager.get_resource_path("assets/logo.png")
-            if os.path.exists(logo_path):
-                self.logo_image = tk.PhotoImage(file=logo_path)
-                
-                # Left logo
-                self.logo_left = tk.Label(
-                    self.header_frame, 
-                    image=self.logo_image, 
-                    bg="#1e1e1e"
-                )
-                self.logo_left.grid(row=0, column=0, padx=(0, 20), sticky="w")
-                
-                # Right logo
-                self.logo_right = tk.Label(
-                    self.header_frame, 
-                    image=self.logo_image, 
-                    bg="#1e1e1e"
-                )
-                self.logo_right.grid(row=0, column=2, padx=(20, 0), sticky="e")
-            else:
-                print(f"Logo file not found at path: {logo_path}")
-        except Exception as e:
-            print(f"Could not load logo: {e}")
+            # Tk reads the file itself and raises if it's missing, so no separate exists() check
+            self.logo_image = tk.PhotoImage(file=logo_path)
+        except tk.TclError as e:
+            logger.warning("Could not load logo from %s: %s", logo_path, e)
+            return
+        
+        # Left logo
+        self.logo_left = tk.Label(
+            self.header_frame, 
+            image=self.logo_image, 
+            bg="#1e1e1e"
+        )
+        self.logo_left.grid(row=0, column=0, padx=(0, 20), sticky="w")
+        
+        # Right logo
+        self.logo_right = tk.Label(
+            self.header_frame, 
+            image=self.logo_image, 
+            bg="#1e1e1e"
+        )
+        self.logo_right.grid(row=0, column=2, padx=(20, 0), sticky="e")
     
     def set_title(self, title: str) -> None:
         """
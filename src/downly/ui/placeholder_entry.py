@@ -0,0 +1,64 @@
+# =====
+#
+#   Downly UI Placeholder Entry
+#
+#   Entry widget with built-in placeholder text handling.
+#
+# =====
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class PlaceholderEntry(ttk.Entry):
+    """
+    Entry widget that shows placeholder text while empty and unfocused.
+    Clears the placeholder on focus and restores it when left empty.
+    """
+    
+    def __init__(self, parent: tk.Widget, placeholder: str, **kwargs):
+        """
+        Initialize placeholder entry.
+        
+        Args:
+            parent: Parent widget to contain this entry
+            placeholder: Placeholder text to display when empty
+            **kwargs: Options passed through to ttk.Entry
+        """
+        super().__init__(parent, **kwargs)
+        self.placeholder = placeholder
+        
+        self.insert(0, placeholder)
+        self.bind('<FocusIn>', self._on_focus_in)
+        self.bind('<FocusOut>', self._on_focus_out)
+    
+    def _on_focus_in(self, event) -> None:
+        """Handle focus in event - clear placeholder if present."""
+        if self.get() == self.placeholder:
+            self.delete(0, tk.END)
+    
+    def _on_focus_out(self, event) -> None:
+        """Handle focus out event - restore placeholder if empty."""
+        if not self.get().strip():
+            self.insert(0, self.placeholder)
+    
+    def get_value(self) -> str:
+        """
+        Get current text, excluding placeholder text.
+        
+        Returns:
+            Current text stripped of surrounding whitespace, empty if placeholder is shown
+        """
+        text = self.get().strip()
+        return "" if text == self.placeholder else text
+    
+    def set_value(self, value: str) -> None:
+        """
+        Set entry text, showing the placeholder if the value is empty.
+        
+        Args:
+            value: Text to set
+        """
+        self.delete(0, tk.END)
+        self.insert(0, value or self.placeholder)
+
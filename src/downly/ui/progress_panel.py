@@ -8,9 +8,7 @@
 
 import tkinter as tk
 from tkinter import ttk
-import re
 from typing import Callable, Optional
-from ..config import AppConfig
 
 
 class ProgressPanel:
@@ -30,9 +28,7 @@ class ProgressPanel:
         
         # State variables
         self.is_downloading = False
-        self.is_mp3_finishing = False
-        self.animation_state = 0
-        self.animation_timer: Optional[str] = None
+        self.progress_text: Optional[str] = None  # Label text last set by set_progress
         
         # Widget references
         self.button_frame: Optional[ttk.Frame] = None
@@ -118,70 +114,56 @@ class ProgressPanel:
         self.on_cancel = on_cancel
     
     def start_download(self) -> None:
-        """Start download state - show loading animation and enable cancel."""
+        """Start download state - show downloading label and enable cancel."""
         self.is_downloading = True
-        self.download_button.config(state="disabled")
+        self.download_button.config(state="disabled", text="Downloading...")
         self.cancel_button.config(state="normal")
         self.progress_label.config(text="Preparing download...")
         self.progress_bar['value'] = 0
-        self.animation_state = 0
-        self._start_animation()
+        self.progress_text = None
     
     def finish_download(self) -> None:
         """Finish download state - reset to ready state."""
-        self._stop_animation()
         self.download_button.config(state="normal", text="Download")
         self.cancel_button.config(state="disabled")
         self.progress_label.config(text="Ready to download")
         self.progress_bar['value'] = 0
+        self.progress_text = None
         self.is_downloading = False
-        self.is_mp3_finishing = False
     
-    def set_progress(self, percent: float, status_line: str = "", is_audio: bool = False) -> None:
+    def set_progress(self, percent: float, details: str = "") -> None:
         """
         Update progress bar and status.
         
         Args:
             percent: Progress percentage (0-100)
-            status_line: Status line from yt-dlp output
-            is_audio: Whether this is an audio download
+            details: Extra progress text such as "ETA 01:23 - 1.20MiB/s"
         """
         percent = max(0, min(percent, 100))
-        self.progress_bar['value'] = percent
+        if details:
+            text = f"Downloading... {percent:.1f}% - {details}"
+        else:
+            text = f"Downloading... {percent:.1f}%"
         
-        # Handle audio extraction finishing state
-        if is_audio and percent >= 100.0 and not self.is_mp3_finishing:
-            self.is_mp3_finishing = True
-            self.progress_label.config(text="Extracting Audio...")
-            return
-        elif is_audio and self.is_mp3_finishing:
+        # Each widget write is a Tcl round trip; skip updates that wouldn't change the display
+        if text == self.progress_text:
             return
-        
-        # Extract and display useful progress information
-        if 'ETA' in status_line:
-            eta_match = re.search(r'ETA (\d+:\d+)', status_line)
-            speed_match = re.search(r'at\s+([^\s]+)', status_line)
-            
-            progress_text = f"Downloading... {percent:.1f}%"
-            
-            if eta_match:
-                progress_text += f" - ETA {eta_match.group(1)}"
-            
-            if speed_match:
-                progress_text += f" - {speed_match.group(1)}/s"
-            
-            self.progress_label.config(text=progress_text)
-        else:
-            self.progress_label.config(text=f"Downloading... {percent:.1f}%")
+        self.progress_text = text
+        self.progress_bar['value'] = percent
+        self.progress_label['text'] = text
     
-    def set_status(self, status: str) -> None:
+    def set_status(self, status: str, percent: Optional[float] = None) -> None:
         """
         Set status text.
         
         Args:
             status: Status text to display
+            percent: Progress percentage to show along with it, if any
         """
         self.progress_label.config(text=status)
+        self.progress_text = None
+        if percent is not None:
+            self.progress_bar['value'] = max(0, min(percent, 100))
     
     def set_success(self) -> None:
         """Set success state."""
@@ -189,7 +171,6 @@ class ProgressPanel:
             return
         self.progress_bar['value'] = 100
         self.progress_label.config(text="Download completed!")
-        self.is_mp3_finishing = False
         self.finish_download()
     
     def set_error(self, error_message: str = "Download failed") -> None:
@@ -202,29 +183,9 @@ class ProgressPanel:
         if not self.is_downloading:  # Don't show error if cancelled
             return
         self.progress_label.config(text=error_message)
-        self.is_mp3_finishing = False
         self.finish_download()
     
     def set_cancelled(self) -> None:
         """Set cancelled state."""
         self.progress_label.config(text="Download cancelled")
         self.finish_download()
-    
-    def _start_animation(self) -> None:
-        """Start download button animation."""
-        self._animate_button_text()
-    
-    def _stop_animation(self) -> None:
-        """Stop download button animation."""
-        if self.animation_timer:
-            self.parent.after_cancel(self.animation_timer)
-            self.animation_timer = None
-    
-    def _animate_button_text(self) -> None:
-        """Animate download button with cycling ellipsis pattern."""
-        ellipsis_patterns = [".  ", ".. ", "...", ".. "]
-        current_pattern = ellipsis_patterns[self.animation_state % len(ellipsis_patterns)]
-        self.download_button.config(text=f"Downloading{current_pattern}")
-        
-        self.animation_state += 1
-        self.animation_timer = self.parent.after(AppConfig.ANIMATION_INTERVAL, self._animate_button_text)
@@ -7,10 +7,12 @@
 # =====
 
 import tkinter as tk
-from tkinter import ttk, filedialog
+from tkinter import ttk
 import os
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 from ..core.preset_manager import PresetManager
+from .placeholder_entry import PlaceholderEntry
+from ..config import TIME_PLACEHOLDER, VIDEO_QUALITIES, AppConfig
 
 
 class SettingsPanel:
@@ -39,7 +41,7 @@ class SettingsPanel:
         self.filename_var = tk.StringVar()
         self.start_time_var = tk.StringVar()
         self.end_time_var = tk.StringVar()
-        self.location_var = tk.StringVar(value=os.path.join(os.path.expanduser("~"), "Downloads"))
+        self.location_var = tk.StringVar(value=AppConfig.DEFAULT_DOWNLOAD_DIR)
         self.metadata_var = tk.BooleanVar(value=False)
         self.subtitles_var = tk.BooleanVar(value=False)
         
@@ -49,8 +51,11 @@ class SettingsPanel:
         self.format_dropdown: Optional[ttk.Combobox] = None
         self.quality_dropdown: Optional[ttk.Combobox] = None
         self.audio_quality_dropdown: Optional[ttk.Combobox] = None
-        self.start_time_entry: Optional[ttk.Entry] = None
-        self.end_time_entry: Optional[ttk.Entry] = None
+        self.start_time_entry: Optional[PlaceholderEntry] = None
+        self.end_time_entry: Optional[PlaceholderEntry] = None
+        
+        # Last enabled state applied to each widget, to skip redundant Tcl calls
+        self._widget_enabled: Dict[ttk.Widget, bool] = {}
         
         self._create_widgets()
         self._bind_events()
@@ -130,7 +135,7 @@ class SettingsPanel:
             textvariable=self.quality_var, 
             style="Modern.TCombobox"
         )
-        self.quality_dropdown["values"] = ("Highest Video Quality", "2160p", "1440p", "1080p", "720p", "480p", "360p", "240p", "144p")
+        self.quality_dropdown["values"] = VIDEO_QUALITIES
         self.quality_dropdown.pack(fill=tk.X, pady=(0, 15), ipady=3)
         
         # Audio quality dropdown
@@ -192,25 +197,25 @@ class SettingsPanel:
         
         # Start time
         ttk.Label(self.time_frame, text="From:", style="SmallLabel.TLabel").pack(side=tk.LEFT)
-        self.start_time_entry = ttk.Entry(
+        self.start_time_entry = PlaceholderEntry(
             self.time_frame, 
+            TIME_PLACEHOLDER,
             textvariable=self.start_time_var, 
             style="Small.TEntry", 
             width=15
         )
         self.start_time_entry.pack(side=tk.LEFT, padx=(5, 10))
-        self.start_time_entry.insert(0, "HH:MM:SS")
         
         # End time
         ttk.Label(self.time_frame, text="To:", style="SmallLabel.TLabel").pack(side=tk.LEFT)
-        self.end_time_entry = ttk.Entry(
+        self.end_time_entry = PlaceholderEntry(
             self.time_frame, 
+            TIME_PLACEHOLDER,
             textvariable=self.end_time_var, 
             style="Small.TEntry", 
             width=15
         )
         self.end_time_entry.pack(side=tk.LEFT, padx=(5, 0))
-        self.end_time_entry.insert(0, "HH:MM:SS")
     
     def _create_location_section(self) -> None:
         """Create download location section."""
@@ -272,12 +277,6 @@ class SettingsPanel:
         self.quality_dropdown.bind("<<ComboboxSelected>>", self._on_custom_change)
         self.audio_quality_dropdown.bind("<<ComboboxSelected>>", self._on_custom_change)
         
-        # Time entry placeholder handling
-        self.start_time_entry.bind('<FocusIn>', self._on_time_focus_in)
-        self.start_time_entry.bind('<FocusOut>', self._on_time_focus_out)
-        self.end_time_entry.bind('<FocusIn>', self._on_time_focus_in)
-        self.end_time_entry.bind('<FocusOut>', self._on_time_focus_out)
-        
         # Configure dropdown selection behavior
         self._configure_dropdown_behavior()
     
@@ -297,15 +296,27 @@ class SettingsPanel:
             dropdown.bind('<Button-1>', self._on_button_release)
             dropdown.bind('<ButtonRelease-1>', self._on_button_release)
     
+    def _set_enabled(self, widget: ttk.Widget, enabled: bool) -> None:
+        """
+        Enable or disable a widget, skipping the call if it is already in that state.
+        
+        Args:
+            widget: ttk widget to update
+            enabled: True to enable, False to disable
+        """
+        if self._widget_enabled.get(widget) != enabled:
+            widget.state(["!disabled" if enabled else "disabled"])
+            self._widget_enabled[widget] = enabled
+    
     def _setup_initial_state(self) -> None:
         """Set up initial widget states."""
         # Apply initial preset
         self._apply_preset()
         
         # Set initial state: preset mode with custom controls disabled
-        self.format_dropdown.state(["disabled"])
-        self.quality_dropdown.state(["disabled"])
-        self.audio_quality_dropdown.state(["disabled"])
+        self._set_enabled(self.format_dropdown, False)
+        self._set_enabled(self.quality_dropdown, False)
+        self._set_enabled(self.audio_quality_dropdown, False)
     
     def _on_preset_format_change(self, event) -> None:
         """Handle preset format change."""
@@ -313,12 +324,12 @@ class SettingsPanel:
         if preset_format == "Custom":
             # Custom mode: disable presets, enable custom controls
             self.preset_quality_var.set("---")
-            self.preset_quality_dropdown.state(["disabled"])
+            self._set_enabled(self.preset_quality_dropdown, False)
             
             # Enable all custom controls
-            self.format_dropdown.state(["!disabled"])
-            self.quality_dropdown.state(["!disabled"])
-            self.audio_quality_dropdown.state(["!disabled"])
+            self._set_enabled(self.format_dropdown, True)
+            self._set_enabled(self.quality_dropdown, True)
+            self._set_enabled(self.audio_quality_dropdown, True)
             
             # Reset custom controls to default values
             self.format_var.set("mp4")
@@ -326,14 +337,14 @@ class SettingsPanel:
             self.audio_quality_var.set("Highest Audio Quality")
         else:
             # Preset mode: enable quality selector, disable custom controls
-            self.preset_quality_dropdown.state(["!disabled"])
+            self._set_enabled(self.preset_quality_dropdown, True)
             if self.preset_quality_var.get() == "---":
                 self.preset_quality_var.set("High")
             
             # Disable custom controls
-            self.format_dropdown.state(["disabled"])
-            self.quality_dropdown.state(["disabled"])
-            self.audio_quality_dropdown.state(["disabled"])
+            self._set_enabled(self.format_dropdown, False)
+            self._set_enabled(self.quality_dropdown, False)
+            self._set_enabled(self.audio_quality_dropdown, False)
             
             # Apply preset settings
             self._apply_preset()
@@ -347,13 +358,13 @@ class SettingsPanel:
         """Handle format change for video quality adjustment."""
         if self.format_var.get() in ["mp3", "m4a"]:
             self.quality_dropdown.set("---")
-            self.quality_dropdown.state(["disabled"])
+            self._set_enabled(self.quality_dropdown, False)
         else:
             if self.quality_dropdown.get() == "---":
                 self.quality_dropdown.set("Highest Video Quality")
             # Only enable if in custom mode
             if self.preset_format_var.get() == "Custom":
-                self.quality_dropdown.state(["!disabled"])
+                self._set_enabled(self.quality_dropdown, True)
         self._on_custom_change(event)
     
     def _on_custom_change(self, event) -> None:
@@ -363,18 +374,6 @@ class SettingsPanel:
             # Revert the change and reapply preset
             self._apply_preset()
     
-    def _on_time_focus_in(self, event) -> None:
-        """Handle time entry focus in."""
-        widget = event.widget
-        if widget.get() == "HH:MM:SS":
-            widget.delete(0, tk.END)
-    
-    def _on_time_focus_out(self, event) -> None:
-        """Handle time entry focus out."""
-        widget = event.widget
-        if not widget.get().strip():
-            widget.insert(0, "HH:MM:SS")
-    
     def _on_focus_out(self, event) -> None:
         """Handle dropdown focus out."""
         widget = event.widget
@@ -383,7 +382,7 @@ class SettingsPanel:
     def _on_button_release(self, event) -> None:
         """Handle dropdown button release."""
         widget = event.widget
-        widget.after(1, lambda: widget.selection_clear())
+        widget.after(1, widget.selection_clear)
     
     def _apply_preset(self) -> None:
         """Apply preset configuration to custom controls."""
@@ -393,17 +392,22 @@ class SettingsPanel:
         if preset_format == "Custom":
             return
         
-        preset_config = self.preset_manager.get_preset(preset_format, preset_quality)
+        preset_values = self.preset_manager.get_preset_values(preset_format, preset_quality)
         
-        if preset_config:
-            # Update custom controls to show what the preset will use
-            self.format_var.set(preset_config["format"])
-            self.quality_var.set(preset_config["video_quality"])
-            self.audio_quality_var.set(preset_config["audio_quality"])
+        if preset_values:
+            video_format, video_quality, audio_quality = preset_values
+            
+            # Audio presets have no video quality
+            if video_format in ["mp3", "m4a"]:
+                video_quality = "---"
             
-            # Update dropdown states based on format
-            if preset_config["format"] in ["mp3", "m4a"]:
-                self.quality_var.set("---")
+            # Update custom controls to show what the preset will use,
+            # only writing the variables whose value actually changes
+            for var, value in ((self.format_var, video_format),
+                               (self.quality_var, video_quality),
+                               (self.audio_quality_var, audio_quality)):
+                if var.get() != value:
+                    var.set(value)
     
     def _browse_download_location(self) -> None:
         """Open file dialog to browse for download location."""
@@ -411,6 +415,9 @@ class SettingsPanel:
         if not os.path.exists(initial_dir):
             initial_dir = os.path.expanduser("~")
         
+        # Loaded on first use; the dialog module isn't needed to show the window
+        from tkinter import filedialog
+        
         folder_selected = filedialog.askdirectory(
             title="Select Download Location",
             initialdir=initial_dir
@@ -28,224 +28,255 @@ class StyleManager:
     
     def configure_all_styles(self) -> None:
         """Configure all UI styles with the current theme."""
-        self._configure_frames()
-        self._configure_labels()
-        self._configure_entries()
-        self._configure_comboboxes()
-        self._configure_buttons()
-        self._configure_progressbar()
-        self._configure_checkbuttons()
-        self._configure_labelframes()
+        self.configure_critical_styles()
+        self.configure_secondary_styles()
     
-    def _configure_frames(self) -> None:
-        """Configure frame styles."""
-        self.style.configure("Main.TFrame", background=self.config.PRIMARY_BG)
-    
-    def _configure_labels(self) -> None:
-        """Configure label styles."""
-        self.style.configure(
-            "Title.TLabel", 
-            foreground=self.config.TEXT_TITLE, 
-            background=self.config.PRIMARY_BG, 
-            font=self.config.TITLE_FONT
-        )
-        self.style.configure(
-            "SubtitleLabel.TLabel", 
-            background=self.config.PRIMARY_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            font=self.config.HEADING_FONT
-        )
-        self.style.configure(
-            "SectionLabel.TLabel", 
-            background=self.config.PRIMARY_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            font=self.config.NORMAL_FONT
-        )
-        self.style.configure(
-            "SmallLabel.TLabel", 
-            background=self.config.PRIMARY_BG, 
-            foreground=self.config.TEXT_SECONDARY, 
-            font=self.config.SMALL_FONT
-        )
-        self.style.configure(
-            "HintLabel.TLabel", 
-            background=self.config.PRIMARY_BG, 
-            foreground=self.config.TEXT_HINT, 
-            font=self.config.TINY_FONT
-        )
-        self.style.configure(
-            "ProgressLabel.TLabel", 
-            background=self.config.PRIMARY_BG, 
-            foreground=self.config.TEXT_SECONDARY, 
-            font=self.config.SMALL_FONT
+    def configure_critical_styles(self) -> None:
+        """Configure the styles needed for the window's first paint."""
+        self._apply_settings(
+            self._frame_settings(),
+            self._label_settings()
         )
     
-    def _configure_entries(self) -> None:
-        """Configure entry widget styles."""
-        # Modern entry style
-        self.style.configure(
-            "Modern.TEntry", 
-            fieldbackground=self.config.SURFACE_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            borderwidth=1, 
-            bordercolor=self.config.BORDER_COLOR, 
-            focuscolor=self.config.BORDER_ACCENT, 
-            insertcolor=self.config.TEXT_PRIMARY, 
-            font=self.config.NORMAL_FONT
-        )
-        
-        # Small entry style
-        self.style.configure(
-            "Small.TEntry", 
-            fieldbackground=self.config.SURFACE_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            borderwidth=1, 
-            bordercolor=self.config.BORDER_COLOR, 
-            focuscolor=self.config.BORDER_ACCENT, 
-            insertcolor=self.config.TEXT_PRIMARY, 
-            font=self.config.SMALL_FONT
-        )
+    def configure_secondary_styles(self) -> None:
+        """
+        Configure the remaining widget styles.
         
-        # Validation styles
-        self.style.configure(
-            "Valid.TEntry", 
-            fieldbackground=self.config.SURFACE_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            borderwidth=1, 
-            bordercolor=self.config.ACCENT_GREEN, 
-            focuscolor=self.config.ACCENT_GREEN, 
-            insertcolor=self.config.TEXT_PRIMARY, 
-            font=self.config.NORMAL_FONT
-        )
-        self.style.configure(
-            "Invalid.TEntry", 
-            fieldbackground=self.config.SURFACE_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            borderwidth=1, 
-            bordercolor=self.config.ACCENT_RED, 
-            focuscolor=self.config.ACCENT_RED, 
-            insertcolor=self.config.TEXT_PRIMARY, 
-            font=self.config.NORMAL_FONT
+        These include the state maps, each of which rebuilds Tk's style
+        database, so the application schedules this after the first paint.
+        """
+        self._apply_settings(
+            self._entry_settings(),
+            self._combobox_settings(),
+            self._button_settings(),
+            self._progressbar_settings(),
+            self._checkbutton_settings(),
+            self._labelframe_settings()
         )
     
-    def _configure_comboboxes(self) -> None:
-        """Configure combobox styles."""
-        self.style.configure(
-            "Modern.TCombobox", 
-            fieldbackground=self.config.SURFACE_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            borderwidth=1, 
-            bordercolor=self.config.BORDER_COLOR, 
-            focuscolor=self.config.BORDER_ACCENT, 
-            arrowcolor=self.config.TEXT_SECONDARY, 
-            background=self.config.PRIMARY_BG, 
-            selectbackground=self.config.SURFACE_BG, 
-            selectforeground=self.config.TEXT_PRIMARY, 
-            font=self.config.NORMAL_FONT
-        )
+    def _apply_settings(self, *groups: dict) -> None:
+        """
+        Install style settings on the current theme in a single Tcl call.
         
-        # Combobox state mappings
-        self.style.map(
-            "Modern.TCombobox", 
-            selectbackground=[("focus", self.config.SURFACE_BG), ("!focus", self.config.SURFACE_BG)], 
-            selectforeground=[("focus", self.config.TEXT_PRIMARY), ("!focus", self.config.TEXT_PRIMARY)], 
-            fieldbackground=[("readonly", self.config.SURFACE_BG), ("focus", self.config.SURFACE_BG), ("disabled", "#3a3a3a")], 
-            bordercolor=[("focus", self.config.BORDER_ACCENT), ("!focus", self.config.BORDER_COLOR), ("disabled", "#555555")], 
-            focuscolor=[("focus", "none"), ("!focus", "none")], 
-            foreground=[("disabled", self.config.TEXT_HINT)], 
-            arrowcolor=[("disabled", "#666666")]
-        )
+        Args:
+            groups: Style settings dicts in ttk theme_settings format
+        """
+        settings = {}
+        for group in groups:
+            settings.update(group)
+        self.style.theme_settings(self.style.theme_use(), settings)
     
-    def _configure_buttons(self) -> None:
-        """Configure button styles."""
-        # Download button
-        self.style.configure(
-            "Download.TButton", 
-            font=self.config.BUTTON_FONT, 
-            foreground=self.config.TEXT_PRIMARY, 
-            background=self.config.ACCENT_GREEN, 
-            borderwidth=0, 
-            focuscolor="none"
-        )
-        self.style.map(
-            "Download.TButton", 
-            background=[("active", self.config.ACCENT_GREEN_HOVER), ("pressed", self.config.ACCENT_GREEN_PRESSED)], 
-            foreground=[("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY)]
-        )
-        
-        # Cancel button
-        self.style.configure(
-            "Cancel.TButton", 
-            font=self.config.BUTTON_FONT, 
-            foreground=self.config.TEXT_PRIMARY, 
-            background=self.config.ACCENT_RED, 
-            borderwidth=0, 
-            focuscolor="none"
-        )
-        self.style.map(
-            "Cancel.TButton", 
-            background=[("active", self.config.ACCENT_RED_HOVER), ("pressed", self.config.ACCENT_RED_PRESSED), ("disabled", "#666666")], 
-            foreground=[("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY), ("disabled", "#999999")]
-        )
-        
-        # Browse button
-        self.style.configure(
-            "Browse.TButton", 
-            font=("Arial", 10), 
-            foreground=self.config.TEXT_PRIMARY, 
-            background=self.config.ACCENT_BLUE, 
-            borderwidth=0, 
-            focuscolor="none"
-        )
-        self.style.map(
-            "Browse.TButton", 
-            background=[("active", "#e73c7e"), ("pressed", "#d63384")], 
-            foreground=[("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY)]
-        )
+    def _frame_settings(self) -> dict:
+        """Build frame styles."""
+        return {
+            "Main.TFrame": {"configure": {"background": self.config.PRIMARY_BG}},
+        }
     
-    def _configure_progressbar(self) -> None:
-        """Configure progress bar style."""
-        self.style.configure(
-            "Modern.Horizontal.TProgressbar", 
-            background=self.config.ACCENT_BLUE, 
-            troughcolor=self.config.SURFACE_BG, 
-            borderwidth=1, 
-            lightcolor=self.config.ACCENT_BLUE, 
-            darkcolor=self.config.ACCENT_BLUE
-        )
+    def _label_settings(self) -> dict:
+        """Build label styles."""
+        return {
+            "Title.TLabel": {"configure": {
+                "foreground": self.config.TEXT_TITLE,
+                "background": self.config.PRIMARY_BG,
+                "font": self.config.TITLE_FONT
+            }},
+            "SubtitleLabel.TLabel": {"configure": {
+                "background": self.config.PRIMARY_BG,
+                "foreground": self.config.TEXT_PRIMARY,
+                "font": self.config.HEADING_FONT
+            }},
+            "SectionLabel.TLabel": {"configure": {
+                "background": self.config.PRIMARY_BG,
+                "foreground": self.config.TEXT_PRIMARY,
+                "font": self.config.NORMAL_FONT
+            }},
+            "SmallLabel.TLabel": {"configure": {
+                "background": self.config.PRIMARY_BG,
+                "foreground": self.config.TEXT_SECONDARY,
+                "font": self.config.SMALL_FONT
+            }},
+            "HintLabel.TLabel": {"configure": {
+                "background": self.config.PRIMARY_BG,
+                "foreground": self.config.TEXT_HINT,
+                "font": self.config.TINY_FONT
+            }},
+            "ProgressLabel.TLabel": {"configure": {
+                "background": self.config.PRIMARY_BG,
+                "foreground": self.config.TEXT_SECONDARY,
+                "font": self.config.SMALL_FONT
+            }},
+        }
     
-    def _configure_checkbuttons(self) -> None:
-        """Configure checkbutton styles."""
-        self.style.configure(
-            "Modern.TCheckbutton", 
-            background=self.config.PRIMARY_BG, 
-            foreground=self.config.TEXT_PRIMARY, 
-            focuscolor="none", 
-            font=self.config.NORMAL_FONT
-        )
-        self.style.map(
-            "Modern.TCheckbutton", 
-            background=[("active", self.config.PRIMARY_BG), ("pressed", self.config.PRIMARY_BG)], 
-            foreground=[("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY)], 
-            indicatorcolor=[("selected", self.config.ACCENT_BLUE), ("!selected", self.config.SURFACE_BG)], 
-            focuscolor=[("focus", "none"), ("!focus", "none")]
-        )
+    def _entry_settings(self) -> dict:
+        """Build entry widget styles."""
+        return {
+            # Modern entry style
+            "Modern.TEntry": {"configure": {
+                "fieldbackground": self.config.SURFACE_BG,
+                "foreground": self.config.TEXT_PRIMARY,
+                "borderwidth": 1,
+                "bordercolor": self.config.BORDER_COLOR,
+                "focuscolor": self.config.BORDER_ACCENT,
+                "insertcolor": self.config.TEXT_PRIMARY,
+                "font": self.config.NORMAL_FONT
+            }},
+            
+            # Small entry style
+            "Small.TEntry": {"configure": {
+                "fieldbackground": self.config.SURFACE_BG,
+                "foreground": self.config.TEXT_PRIMARY,
+                "borderwidth": 1,
+                "bordercolor": self.config.BORDER_COLOR,
+                "focuscolor": self.config.BORDER_ACCENT,
+                "insertcolor": self.config.TEXT_PRIMARY,
+                "font": self.config.SMALL_FONT
+            }},
+            
+            # Validation styles
+            "Valid.TEntry": {"configure": {
+                "fieldbackground": self.config.SURFACE_BG,
+                "foreground": self.config.TEXT_PRIMARY,
+                "borderwidth": 1,
+                "bordercolor": self.config.ACCENT_GREEN,
+                "focuscolor": self.config.ACCENT_GREEN,
+                "insertcolor": self.config.TEXT_PRIMARY,
+                "font": self.config.NORMAL_FONT
+            }},
+            "Invalid.TEntry": {"configure": {
+                "fieldbackground": self.config.SURFACE_BG,
+                "foreground": self.config.TEXT_PRIMARY,
+                "borderwidth": 1,
+                "bordercolor": self.config.ACCENT_RED,
+                "focuscolor": self.config.ACCENT_RED,
+                "insertcolor": self.config.TEXT_PRIMARY,
+                "font": self.config.NORMAL_FONT
+            }},
+        }
     
-    def _configure_labelframes(self) -> None:
-        """Configure labelframe styles."""
-        self.style.configure(
-            "Modern.TLabelframe", 
-            background=self.config.PRIMARY_BG, 
-            borderwidth=1, 
-            relief="solid", 
-            bordercolor=self.config.BORDER_COLOR
-        )
-        self.style.configure(
-            "Modern.TLabelframe.Label", 
-            background=self.config.PRIMARY_BG, 
-            foreground=self.config.ACCENT_BLUE, 
-            font=self.config.HEADING_FONT
-        )
+    def _combobox_settings(self) -> dict:
+        """Build combobox styles."""
+        return {
+            "Modern.TCombobox": {
+                "configure": {
+                    "fieldbackground": self.config.SURFACE_BG,
+                    "foreground": self.config.TEXT_PRIMARY,
+                    "borderwidth": 1,
+                    "bordercolor": self.config.BORDER_COLOR,
+                    "focuscolor": self.config.BORDER_ACCENT,
+                    "arrowcolor": self.config.TEXT_SECONDARY,
+                    "background": self.config.PRIMARY_BG,
+                    "selectbackground": self.config.SURFACE_BG,
+                    "selectforeground": self.config.TEXT_PRIMARY,
+                    "font": self.config.NORMAL_FONT
+                },
+                # Combobox state mappings
+                "map": {
+                    "selectbackground": [("focus", self.config.SURFACE_BG), ("!focus", self.config.SURFACE_BG)],
+                    "selectforeground": [("focus", self.config.TEXT_PRIMARY), ("!focus", self.config.TEXT_PRIMARY)],
+                    "fieldbackground": [("readonly", self.config.SURFACE_BG), ("focus", self.config.SURFACE_BG), ("disabled", self.config.DISABLED_BG)],
+                    "bordercolor": [("focus", self.config.BORDER_ACCENT), ("!focus", self.config.BORDER_COLOR), ("disabled", self.config.DISABLED_BORDER)],
+                    "focuscolor": [("focus", "none"), ("!focus", "none")],
+                    "foreground": [("disabled", self.config.TEXT_HINT)],
+                    "arrowcolor": [("disabled", self.config.DISABLED_ACCENT)]
+                },
+            },
+        }
+    
+    def _button_settings(self) -> dict:
+        """Build button styles."""
+        return {
+            # Download button
+            "Download.TButton": {
+                "configure": {
+                    "font": self.config.BUTTON_FONT,
+                    "foreground": self.config.TEXT_PRIMARY,
+                    "background": self.config.ACCENT_GREEN,
+                    "borderwidth": 0,
+                    "focuscolor": "none"
+                },
+                "map": {
+                    "background": [("active", self.config.ACCENT_GREEN_HOVER), ("pressed", self.config.ACCENT_GREEN_PRESSED)],
+                    "foreground": [("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY)]
+                },
+            },
+            
+            # Cancel button
+            "Cancel.TButton": {
+                "configure": {
+                    "font": self.config.BUTTON_FONT,
+                    "foreground": self.config.TEXT_PRIMARY,
+                    "background": self.config.ACCENT_RED,
+                    "borderwidth": 0,
+                    "focuscolor": "none"
+                },
+                "map": {
+                    "background": [("active", self.config.ACCENT_RED_HOVER), ("pressed", self.config.ACCENT_RED_PRESSED), ("disabled", self.config.DISABLED_ACCENT)],
+                    "foreground": [("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY), ("disabled", self.config.DISABLED_TEXT)]
+                },
+            },
+            
+            # Browse button
+            "Browse.TButton": {
+                "configure": {
+                    "font": self.config.NORMAL_FONT,
+                    "foreground": self.config.TEXT_PRIMARY,
+                    "background": self.config.ACCENT_BLUE,
+                    "borderwidth": 0,
+                    "focuscolor": "none"
+                },
+                "map": {
+                    "background": [("active", self.config.ACCENT_BLUE_HOVER), ("pressed", self.config.ACCENT_BLUE_PRESSED)],
+                    "foreground": [("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY)]
+                },
+            },
+        }
+    
+    def _progressbar_settings(self) -> dict:
+        """Build progress bar style."""
+        return {
+            "Modern.Horizontal.TProgressbar": {"configure": {
+                "background": self.config.ACCENT_BLUE,
+                "troughcolor": self.config.SURFACE_BG,
+                "borderwidth": 1,
+                "lightcolor": self.config.ACCENT_BLUE,
+                "darkcolor": self.config.ACCENT_BLUE
+            }},
+        }
+    
+    def _checkbutton_settings(self) -> dict:
+        """Build checkbutton styles."""
+        return {
+            "Modern.TCheckbutton": {
+                "configure": {
+                    "background": self.config.PRIMARY_BG,
+                    "foreground": self.config.TEXT_PRIMARY,
+                    "focuscolor": "none",
+                    "font": self.config.NORMAL_FONT
+                },
+                "map": {
+                    "background": [("active", self.config.PRIMARY_BG), ("pressed", self.config.PRIMARY_BG)],
+                    "foreground": [("active", self.config.TEXT_PRIMARY), ("pressed", self.config.TEXT_PRIMARY)],
+                    "indicatorcolor": [("selected", self.config.ACCENT_BLUE), ("!selected", self.config.SURFACE_BG)],
+                    "focuscolor": [("focus", "none"), ("!focus", "none")]
+                },
+            },
+        }
+    
+    def _labelframe_settings(self) -> dict:
+        """Build labelframe styles."""
+        return {
+            "Modern.TLabelframe": {"configure": {
+                "background": self.config.PRIMARY_BG,
+                "borderwidth": 1,
+                "relief": "solid",
+                "bordercolor": self.config.BORDER_COLOR
+            }},
+            "Modern.TLabelframe.Label": {"configure": {
+                "background": self.config.PRIMARY_BG,
+                "foreground": self.config.ACCENT_BLUE,
+                "font": self.config.HEADING_FONT
+            }},
+        }
     
     def configure_dropdown_listbox(self, root) -> None:
         """Configure dropdown listbox styling using option_add."""
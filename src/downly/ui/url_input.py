@@ -9,6 +9,8 @@
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
+from .placeholder_entry import PlaceholderEntry
+from ..config import URL_PLACEHOLDER
 
 
 class URLInput:
@@ -17,7 +19,7 @@ class URLInput:
     Provides clean interface for URL entry and validation feedback.
     """
     
-    def __init__(self, parent: tk.Widget, placeholder: str = "Paste YouTube link here..."):
+    def __init__(self, parent: tk.Widget, placeholder: str = URL_PLACEHOLDER):
         """
         Initialize URL input component.
         
@@ -33,14 +35,13 @@ class URLInput:
         
         # Widget references
         self.url_frame: Optional[ttk.LabelFrame] = None
-        self.url_entry: Optional[ttk.Entry] = None
+        self.url_entry: Optional[PlaceholderEntry] = None
         
         # Callbacks
         self.on_url_change: Optional[Callable[[str], None]] = None
         
         self._create_widgets()
         self._bind_events()
-        self._set_initial_state()
     
     def _create_widgets(self) -> None:
         """Create the URL input widgets."""
@@ -52,33 +53,18 @@ class URLInput:
         )
         self.url_frame.pack(fill=tk.X, pady=(0, 15))
         
-        self.url_entry = ttk.Entry(
+        self.url_entry = PlaceholderEntry(
             self.url_frame, 
+            self.placeholder,
             textvariable=self.url_var,
             style="Modern.TEntry"
         )
         self.url_entry.pack(fill=tk.X)
     
     def _bind_events(self) -> None:
-        """Bind events for placeholder management."""
-        self.url_entry.bind('<FocusIn>', self._on_focus_in)
-        self.url_entry.bind('<FocusOut>', self._on_focus_out)
+        """Bind events for URL change notifications."""
         self.url_var.trace('w', self._on_url_change_internal)
     
-    def _set_initial_state(self) -> None:
-        """Set initial placeholder state."""
-        self.url_entry.insert(0, self.placeholder)
-    
-    def _on_focus_in(self, event) -> None:
-        """Handle focus in event - clear placeholder if present."""
-        if self.url_entry.get() == self.placeholder:
-            self.url_entry.delete(0, tk.END)
-    
-    def _on_focus_out(self, event) -> None:
-        """Handle focus out event - restore placeholder if empty."""
-        if not self.url_entry.get().strip():
-            self.url_entry.insert(0, self.placeholder)
-    
     def _on_url_change_internal(self, *args) -> None:
         """Internal handler for URL changes."""
         if self.on_url_change:
@@ -92,8 +78,7 @@ class URLInput:
         Returns:
             Current URL string, empty if placeholder is shown
         """
-        current_text = self.url_var.get().strip()
-        return "" if current_text == self.placeholder else current_text
+        return self.url_entry.get_value()
     
     def set_url(self, url: str) -> None:
         """
@@ -102,16 +87,11 @@ class URLInput:
         Args:
             url: URL string to set
         """
-        self.url_entry.delete(0, tk.END)
-        if url:
-            self.url_entry.insert(0, url)
-        else:
-            self.url_entry.insert(0, self.placeholder)
+        self.url_entry.set_value(url)
     
     def clear(self) -> None:
         """Clear URL input and restore placeholder."""
-        self.url_entry.delete(0, tk.END)
-        self.url_entry.insert(0, self.placeholder)
+        self.url_entry.set_value("")
     
     def set_validation_style(self, is_valid: Optional[bool]) -> None:
         """
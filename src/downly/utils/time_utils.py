@@ -6,8 +6,8 @@
 #
 # =====
 
-import re
 from typing import Optional, Union
+from ..config import TIME_PLACEHOLDER
 
 
 class TimeValidator:
@@ -16,15 +16,11 @@ class TimeValidator:
     Supports multiple time formats: HH:MM:SS, MM:SS, and SS.
     """
     
-    # Time format patterns
-    PATTERNS = [
-        r'^(\d{1,2}):(\d{2}):(\d{2})$',  # H:MM:SS or HH:MM:SS
-        r'^(\d{1,2}):(\d{2})$',          # MM:SS
-        r'^(\d+)$'                       # SS only
-    ]
+    # Returned for malformed input; unlike False it can't be mistaken for 0 seconds
+    INVALID = object()
     
     @staticmethod
-    def validate_time_format(time_str: str) -> Union[int, bool]:
+    def validate_time_format(time_str: str) -> Union[int, None, object]:
         """
         Validate and convert time string to seconds.
         
@@ -32,33 +28,38 @@ class TimeValidator:
             time_str: Time string in format HH:MM:SS, MM:SS, or SS
             
         Returns:
-            Number of seconds if valid, False if invalid, None if empty/placeholder
+            Number of seconds if valid, TimeValidator.INVALID if invalid,
+            None if empty/placeholder
         """
-        if not time_str or time_str.strip() == "" or time_str.strip() == "HH:MM:SS":
+        time_str = time_str.strip() if time_str else ""
+        if not time_str or time_str == TIME_PLACEHOLDER:
             return None
 
-        time_str = time_str.strip()
-
-        for pattern in TimeValidator.PATTERNS:
-            match = re.match(pattern, time_str)
-            if match:
-                groups = match.groups()
-                if len(groups) == 3:  # H:MM:SS or HH:MM:SS
-                    hours, minutes, seconds = map(int, groups)
-                    # Validate ranges
-                    if minutes >= 60 or seconds >= 60:
-                        return False
-                    return hours * 3600 + minutes * 60 + seconds
-                elif len(groups) == 2:  # MM:SS
-                    minutes, seconds = map(int, groups)
-                    # Validate ranges
-                    if seconds >= 60:
-                        return False
-                    return minutes * 60 + seconds
-                else:  # SS only
-                    return int(groups[0])
-
-        return False
+        # The grammar is simple enough to check field by field without a regex
+        parts = time_str.split(':')
+        if len(parts) > 3 or not all(part.isdecimal() for part in parts):
+            return TimeValidator.INVALID
+        
+        if len(parts) == 1:  # SS only
+            return int(parts[0])
+        
+        # MM:SS, H:MM:SS or HH:MM:SS: one or two leading digits, then exactly two per field
+        if len(parts[0]) > 2 or any(len(part) != 2 for part in parts[1:]):
+            return TimeValidator.INVALID
+        
+        if len(parts) == 2:  # MM:SS
+            minutes, seconds = int(parts[0]), int(parts[1])
+            # Validate ranges
+            if seconds >= 60:
+                return TimeValidator.INVALID
+            return minutes * 60 + seconds
+        
+        # H:MM:SS or HH:MM:SS
+        hours, minutes, seconds = int(parts[0]), int(parts[1]), int(parts[2])
+        # Validate ranges
+        if minutes >= 60 or seconds >= 60:
+            return TimeValidator.INVALID
+        return hours * 3600 + minutes * 60 + seconds
     
     @staticmethod
     def format_seconds_to_time(seconds: int) -> str:
@@ -71,13 +72,14 @@ class TimeValidator:
         Returns:
             Time string in HH:MM:SS format
         """
-        hours, remainder = divmod(seconds, 3600)
+        # Coerce once so the arithmetic and formatting stay on ints
+        hours, remainder = divmod(int(seconds), 3600)
         minutes, seconds = divmod(remainder, 60)
-        return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
     
     @staticmethod
     def validate_time_interval(start_time: str, end_time: str, 
-                             placeholder: str = "HH:MM:SS") -> tuple[Optional[int], Optional[int], Optional[str]]:
+                             placeholder: str = TIME_PLACEHOLDER) -> tuple[Optional[int], Optional[int], Optional[str]]:
         """
         Validate a time interval (start and end times).
         
@@ -97,13 +99,13 @@ class TimeValidator:
         # Validate start time
         if start_time and start_time not in ["", placeholder, "00:00:00"]:
             start_seconds = TimeValidator.validate_time_format(start_time)
-            if start_seconds is False:
+            if start_seconds is TimeValidator.INVALID:
                 return None, None, "Invalid start time format. Use HH:MM:SS (e.g., 01:30:00), MM:SS (e.g., 90:00), or SS (e.g., 54)"
         
         # Validate end time
         if end_time and end_time not in ["", placeholder]:
             end_seconds = TimeValidator.validate_time_format(end_time)
-            if end_seconds is False:
+            if end_seconds is TimeValidator.INVALID:
                 return None, None, "Invalid end time format. Use HH:MM:SS (e.g., 02:45:30), MM:SS (e.g., 15:30), or SS (e.g., 30)"
             
             if start_seconds is not None and end_seconds <= start_seconds:
@@ -112,6 +114,18 @@ class TimeValidator:
         return start_seconds, end_seconds, None
 
 
+# Invalid filename characters are removed; dashes and ellipses get ASCII equivalents.
+# Control characters are invalid too; whitespace ones are left for space collapsing.
+_INVALID_FILENAME_CHARS = '<>:"/\\|?*' + ''.join(c for c in map(chr, range(32)) if not c.isspace())
+_INVALID_FILENAME_BYTES = _INVALID_FILENAME_CHARS.encode('ascii')
+_FILENAME_TRANSLATION = str.maketrans({
+    **dict.fromkeys(_INVALID_FILENAME_CHARS),
+    '–': '-',    # en dash to hyphen
+    '—': '-',    # em dash to hyphen
+    '…': '...',  # ellipsis
+})
+
+
 class FilenameUtils:
     """Utility functions for filename handling."""
     
@@ -126,16 +140,12 @@ class FilenameUtils:
         Returns:
             Sanitized filename safe for file system
         """
-        # Remove invalid filename characters
-        invalid_chars = '<>:"/\\|?*'
-        translation_table = str.maketrans('', '', invalid_chars)
-        clean_name = filename.translate(translation_table)
-        
-        # Replace problematic characters with safe alternatives
-        clean_name = clean_name.replace('–', '-')  # em dash to hyphen
-        clean_name = clean_name.replace('—', '-')  # en dash to hyphen
-        clean_name = clean_name.replace('"', "'")  # double quotes to single
-        clean_name = clean_name.replace('…', '...')  # ellipsis
+        # Remove invalid filename characters and replace problematic ones in one pass.
+        # ASCII titles have nothing to replace, so a byte-level delete is enough and much faster.
+        if filename.isascii():
+            clean_name = filename.encode('ascii').translate(None, _INVALID_FILENAME_BYTES).decode('ascii')
+        else:
+            clean_name = filename.translate(_FILENAME_TRANSLATION)
         
         # Remove multiple spaces and trim
         clean_name = ' '.join(clean_name.split())